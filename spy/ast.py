@@ -32,18 +32,19 @@ class AST:
         """
         Compute .loc for itself and all its descendants.
         """
+        # this is called on every node of every parsed module, so we avoid
+        # hasattr() and do a single getattr() instead. Nodes which have a
+        # lineno always have end_lineno & co. as well.
         for py_node in py_ast.walk(self):  # type: ignore
-            if hasattr(py_node, 'lineno'):
-                assert py_node.end_lineno is not None
-                assert py_node.end_col_offset is not None
-                loc = Loc(
+            lineno = getattr(py_node, 'lineno', None)
+            if lineno is not None:
+                py_node._loc = Loc(
                     filename = filename,
-                    line_start = py_node.lineno,
-                    line_end = py_node.end_lineno,
+                    line_start = lineno,
+                    line_end = py_node.end_lineno,  # type: ignore
                     col_start = py_node.col_offset,
-                    col_end = py_node.end_col_offset,
+                    col_end = py_node.end_col_offset,  # type: ignore
                 )
-                py_node._loc = loc
 
     @typing.no_type_check
     def pp(self, *, hl=None) -> None:
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from spy.fqn import FQN
 from spy.vm.vm import SPyVM
 from spy.vm.b import B
@@ -35,18 +35,21 @@ class C_Function:
     name: str
     params: list[C_FuncParam]
     c_restype: C_Type
+    _decl: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # C_Functions are immutable, so we can compute the declaration once
+        if self.params == []:
+            s_params = 'void'
+        else:
+            s_params = ', '.join([f'{p.c_type} {p.name}' for p in self.params])
+        self._decl = '%s %s(%s)' % (self.c_restype, self.name, s_params)
 
     def __repr__(self) -> str:
         return f"<C func '{self.name}'>"
 
     def decl(self) -> str:
-        if self.params == []:
-            s_params = 'void'
-        else:
-            paramlist = [f'{p.c_type} {p.name}' for p in self.params]
-            s_params = ', '.join(paramlist)
-        #
-        return f'{self.c_restype} {self.name}({s_params})'
+        return self._decl
 
 
 class Context:
@@ -60,6 +63,7 @@ class Context:
     out_ptrs_def: TextBuilder
     out_types_def: TextBuilder
     _d: dict[W_Type, C_Type]
+    _restype_cache: dict[FQN, C_Type]
 
     def __init__(self, vm: SPyVM) -> None:
         self.vm = vm
@@ -75,10 +79,14 @@ class Context:
         self._d[B.w_str] = C_Type('spy_Str *')
         self._d[RB.w_RawBuffer] = C_Type('spy_RawBuffer *')
         self._d[JSFFI.w_JsRef] = C_Type('JsRef')
+        self._restype_cache = {}
 
     def w2c(self, w_type: W_Type) -> C_Type:
-        if w_type in self._d:
-            return self._d[w_type]
+        # fast path: builtin types and the types already translated are in
+        # self._d, so they need a single dict lookup
+        c_type = self._d.get(w_type)
+        if c_type is not None:
+            return c_type
         elif isinstance(w_type, W_PtrType):
             return self.new_ptr_type(w_type)
         elif isinstance(w_type, W_StructType):
@@ -88,10 +96,14 @@ class Context:
         raise NotImplementedError(f'Cannot translate type {w_type} to C')
 
     def c_restype_by_fqn(self, fqn: FQN) -> C_Type:
-        w_func = self.vm.lookup_global(fqn)
-        assert isinstance(w_func, W_Func)
-        w_restype = w_func.w_functype.w_restype
-        return self.w2c(w_restype)
+        c_restype = self._restype_cache.get(fqn)
+        if c_restype is None:
+            w_func = self.vm.lookup_global(fqn)
+            assert isinstance(w_func, W_Func)
+            w_restype = w_func.w_functype.w_restype
+            c_restype = self.w2c(w_restype)
+            self._restype_cache[fqn] = c_restype
+        return c_restype
 
     def c_function(self, name: str, w_functype: W_FuncType) -> C_Function:
         c_restype = self.w2c(w_functype.w_restype)
@@ -131,19 +143,17 @@ class Context:
         # only 32-bit types it should work, but eventually we need to do it
         # properly.
         #
-        # Write the struct definition in a detached builder. This is necessary
-        # because the call to w2c might trigger OTHER type definitions, so we
-        # must ensure that we write the whole "struct { ... }" block
-        # atomically.
-        out = self.out_types_def.make_nested_builder(detached=True)
-        out.wl("struct %s {" % c_struct_type)
-        with out.indent():
-            for field, w_fieldtype in w_st.fields.items():
-                c_fieldtype = self.w2c(w_fieldtype)
-                out.wl(f"{c_fieldtype} {field};")
-        out.wl("};")
-        out.wl("")
-        self.out_types_def.attach_nested_builder(out)
+        # Compute all the field types BEFORE writing anything: the calls to
+        # w2c might trigger OTHER type definitions, and we must ensure that
+        # the whole "struct { ... }" block is written atomically.
+        lines = [f"struct {c_struct_type} {{"]
+        lines += [
+            f"    {self.w2c(w_fieldtype)} {field};"
+            for field, w_fieldtype in w_st.fields.items()
+        ]
+        lines.append("};")
+        self.out_types_def.wb('\n'.join(lines))
+        self.out_types_def.wl()
         return c_struct_type
 
     def new_lifted_type(self, w_hltype: W_LiftedType) -> C_Type:
@@ -216,11 +216,12 @@ class CFuncWriter:
         see e.g. a VarDef.
         """
         assert self.w_func.locals_types_w is not None
-        param_names = [p.name for p in self.w_func.w_functype.params]
+        # params and special variables are not declared
+        skip = {'@return', '@if', '@while'}
+        skip.update(p.name for p in self.w_func.w_functype.params)
         for varname, w_type in self.w_func.locals_types_w.items():
-            c_type = self.ctx.w2c(w_type)
-            if (varname not in ('@return', '@if', '@while') and
-                varname not in param_names):
+            if varname not in skip:
+                c_type = self.ctx.w2c(w_type)
                 self.out.wl(f'{c_type} {varname};')
 
     # ==============
@@ -1,5 +1,5 @@
 import struct
-from typing import Any, Optional
+from typing import Any, Optional, Callable
 from dataclasses import dataclass
 import py.path
 import wasmtime
@@ -16,6 +16,8 @@ from spy.vm.modules.rawbuffer import RB
 from spy.vm.modules.unsafe.ptr import W_PtrType
 from spy.vm.modules.types import W_LiftedType, UnwrappedLiftedObject
 
+ARG_WRITER = Callable[[list[Any], Any], None]
+
 @dataclass
 class WasmPtr:
     addr: int
@@ -69,6 +71,8 @@ class WasmFuncWrapper:
     ll: LLSPyInstance
     c_name: str
     w_functype: W_FuncType
+    arg_writers: list[ARG_WRITER]
+    read_result: Callable[[Any], Any]
 
     def __init__(self, vm: SPyVM, ll: LLSPyInstance, c_name: str,
                  w_functype: W_FuncType) -> None:
@@ -76,16 +80,32 @@ class WasmFuncWrapper:
         self.ll = ll
         self.c_name = c_name
         self.w_functype = w_functype
-
-    def py2wasm(self, pyval: Any, w_type: W_Type) -> Any:
-        if w_type in (B.w_i32, B.w_f64):
-            return pyval
+        self.arg_writers = [self.make_arg_writer(p.w_type)
+                            for p in w_functype.params]
+        self.read_result = self.make_result_reader(w_functype.w_restype)
+
+    def make_arg_writer(self, w_type: W_Type) -> ARG_WRITER:
+        """
+        Return a function which converts an interp-level value of type w_type
+        into WASM values, and appends them to the given list of args.
+
+        See also make_result_reader.
+        """
+        ll = self.ll
+        if w_type is B.w_i32 or w_type is B.w_f64:
+            return list.append
         elif w_type is B.w_str:
-            # XXX: with the GC, we need to think how to keep this alive
-            return ll_spy_Str_new(self.ll, pyval)
+            def write_str(wasm_args: list[Any], pyval: Any) -> None:
+                # XXX: with the GC, we need to think how to keep this alive
+                wasm_args.append(ll_spy_Str_new(ll, pyval))
+            return write_str
         elif isinstance(w_type, W_PtrType):
-            assert isinstance(pyval, WasmPtr)
-            return (pyval.addr, pyval.length)
+            def write_ptr(wasm_args: list[Any], pyval: Any) -> None:
+                # special case for multivalue
+                assert isinstance(pyval, WasmPtr)
+                wasm_args.append(pyval.addr)
+                wasm_args.append(pyval.length)
+            return write_ptr
         else:
             assert False, f'Unsupported type: {w_type}'
 
@@ -96,55 +116,64 @@ class WasmFuncWrapper:
             raise TypeError(f'{self.c_name}: expected {b} arguments, got {a}')
         #
         wasm_args: list[Any] = []
-        for py_arg, param in zip(py_args, self.w_functype.params):
-            wasm_arg = self.py2wasm(py_arg, param.w_type)
-            if type(wasm_arg) is tuple:
-                # special case for multivalue
-                wasm_args += wasm_arg
-            else:
-                wasm_args.append(wasm_arg)
+        for write_arg, py_arg in zip(self.arg_writers, py_args):
+            write_arg(wasm_args, py_arg)
         return wasm_args
 
-    def to_py_result(self, w_type: W_Type, res: Any) -> Any:
+    def make_result_reader(self, w_type: W_Type) -> Callable[[Any], Any]:
+        """
+        Return a function which converts a raw WASM result of type w_type
+        into an interp-level value.
+
+        The dispatch on w_type is done once here, so that __call__ doesn't
+        have to do it again on every call.
+        """
+        mem = self.ll.mem
         if w_type is B.w_void:
-            assert res is None
-            return None
-        elif w_type is B.w_i32:
-            return res
-        elif w_type is B.w_f64:
-            return res
+            def read_void(res: Any) -> Any:
+                assert res is None
+                return None
+            return read_void
+        elif w_type is B.w_i32 or w_type is B.w_f64:
+            return lambda res: res
         elif w_type is B.w_bool:
-            return bool(res)
+            return bool
         elif w_type is B.w_str:
-            # res is a  spy_Str*
-            addr = res
-            length = self.ll.mem.read_i32(addr)
-            utf8 = self.ll.mem.read(addr + 4, length)
-            return utf8.decode('utf-8')
+            def read_str(res: Any) -> Any:
+                # res is a  spy_Str*
+                addr = res
+                length = mem.read_i32(addr)
+                utf8 = mem.read(addr + 4, length)
+                return utf8.decode('utf-8')
+            return read_str
         elif w_type is RB.w_RawBuffer:
-            # res is a  spy_RawBuffer*
-            addr = res
-            length = self.ll.mem.read_i32(addr)
-            buf = self.ll.mem.read(addr + 4, length)
-            return buf
+            def read_rawbuffer(res: Any) -> Any:
+                # res is a  spy_RawBuffer*
+                addr = res
+                length = mem.read_i32(addr)
+                buf = mem.read(addr + 4, length)
+                return buf
+            return read_rawbuffer
         elif isinstance(w_type, W_PtrType):
             # this assumes that we compiled libspy with SPY_DEBUG:
             #   - checked ptrs are represented as a struct { addr; length }
             #   - res contains a a list [addr, length] (because of WASM
             #     multivalue)
-            addr, length = res
-            return WasmPtr(addr, length)
+            def read_ptr(res: Any) -> Any:
+                addr, length = res
+                return WasmPtr(addr, length)
+            return read_ptr
         elif isinstance(w_type, W_LiftedType):
             w_hltype = w_type
-            llval = self.to_py_result(w_hltype.w_lltype, res)
-            return UnwrappedLiftedObject(w_hltype, llval)
+            read_ll = self.make_result_reader(w_hltype.w_lltype)
+            def read_lifted(res: Any) -> Any:
+                return UnwrappedLiftedObject(w_hltype, read_ll(res))
+            return read_lifted
         else:
             assert False, f"Don't know how to read {w_type} from WASM"
 
-
     def __call__(self, *py_args: Any, unwrap: bool = True) -> Any:
         assert unwrap, 'unwrap=False is not supported by the C backend'
         wasm_args = self.from_py_args(py_args)
         res = self.ll.call(self.c_name, *wasm_args)
-        w_type = self.w_functype.w_restype
-        return self.to_py_result(w_type, res)
+        return self.read_result(res)
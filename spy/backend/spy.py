@@ -199,11 +199,14 @@ class SPyBackend:
         return name.id
 
     def fmt_expr_BinOp(self, binop: ast.BinOp) -> str:
-        l = self.fmt_expr(binop.left)
-        r = self.fmt_expr(binop.right)
-        if binop.left.precedence < binop.precedence:
+        left = binop.left
+        right = binop.right
+        prec = binop.precedence
+        l = self.fmt_expr(left)
+        r = self.fmt_expr(right)
+        if left.precedence < prec:
             l = f'({l})'
-        if binop.right.precedence < binop.precedence:
+        if right.precedence < prec:
             r = f'({r})'
         return f'{l} {binop.op} {r}'
 
@@ -1,4 +1,5 @@
 from typing import Optional, Literal
+from enum import Enum
 import subprocess
 import py.path
 import spy.libspy
@@ -7,6 +8,12 @@ from spy.textbuilder import Color
 FORCE_COLORS=True
 BUILD_TYPE = Literal['release', 'debug']
 
+class ToolchainType(str, Enum):
+    zig = "zig"
+    clang = "clang"
+    emscripten = "emscripten"
+    native = "native"
+
 def get_toolchain(toolchain: str, *, build_type: BUILD_TYPE) -> 'Toolchain':
     if toolchain == 'zig':
         return ZigToolchain(build_type)
@@ -1,5 +1,6 @@
 import sys
-from typing import Annotated, Any, no_type_check, Optional
+from typing import (Annotated, Any, no_type_check, Optional,
+                    TYPE_CHECKING)
 from pathlib import Path
 import time
 import traceback
@@ -7,19 +8,16 @@ from dataclasses import dataclass
 import click
 import typer
 from typer import Option
-import py.path
 import pdb as stdlib_pdb # to distinguish from the "--pdb" option
 from spy.vendored.dataclass_typer import dataclass_typer
-from spy.magic_py_parse import magic_py_parse
 from spy.errors import SPyError
-from spy.parser import Parser
-from spy.backend.spy import SPyBackend, FQN_FORMAT
-from spy.compiler import Compiler, ToolchainType
-from spy.cbuild import get_toolchain, BUILD_TYPE
-from spy.irgen.scope import ScopeAnalyzer
-from spy.vm.b import B
-from spy.vm.vm import SPyVM
-from spy.vm.function import W_ASTFunc, W_Func, W_FuncType
+from spy.cbuild import get_toolchain, BUILD_TYPE, ToolchainType
+
+# NOTE: the parser, the VM and the compiler are imported lazily inside the
+# functions which need them, to keep the startup time of the CLI low
+# (e.g. for --help or --pyparse)
+if TYPE_CHECKING:
+    from spy.vm.vm import SPyVM
 
 app = typer.Typer(pretty_exceptions_enable=False)
 
@@ -112,13 +110,14 @@ class Arguments:
 
 
 def do_pyparse(filename: str) -> None:
-    import ast as py_ast
+    from spy.magic_py_parse import magic_py_parse
     with open(filename) as f:
         src = f.read()
     mod = magic_py_parse(src)
     mod.pp()
 
-def dump_spy_mod(vm: SPyVM, modname: str, pretty: bool) -> None:
+def dump_spy_mod(vm: 'SPyVM', modname: str, pretty: bool) -> None:
+    from spy.backend.spy import SPyBackend, FQN_FORMAT
     fqn_format: FQN_FORMAT = 'short' if pretty else 'full'
     b = SPyBackend(vm, fqn_format=fqn_format)
     print(b.dump_mod(modname))
@@ -149,6 +148,14 @@ def do_main(args: Arguments) -> None:
         do_pyparse(str(args.filename))
         return
 
+    import py.path
+    from spy.parser import Parser
+    from spy.compiler import Compiler
+    from spy.irgen.scope import ScopeAnalyzer
+    from spy.vm.b import B
+    from spy.vm.vm import SPyVM
+    from spy.vm.function import W_Func, W_FuncType
+
     modname = args.filename.stem
     builddir = args.filename.parent
     vm = SPyVM()
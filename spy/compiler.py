@@ -1,8 +1,7 @@
 import os
-from enum import Enum
 import py.path
 from spy.backend.c.cwriter import CModuleWriter
-from spy.cbuild import get_toolchain, BUILD_TYPE
+from spy.cbuild import get_toolchain, BUILD_TYPE, ToolchainType
 from spy.vm.vm import SPyVM
 from spy.vm.module import W_Module
 from spy.vm.function import W_ASTFunc
@@ -11,12 +10,6 @@ from spy.util import highlight_C_maybe
 
 DUMP_WASM = False
 
-class ToolchainType(str, Enum):
-    zig = "zig"
-    clang = "clang"
-    emscripten = "emscripten"
-    native = "native"
-
 class Compiler:
     """
     Take a module inside a VM and compile it to C/WASM.
@@ -47,6 +47,10 @@ def make_const(vm: 'SPyVM', loc: Loc, w_val: W_Object) -> ast.Expr:
     return ast.FQNConst(loc, fqn)
 
 
+def is_const_bool(expr: ast.Expr, value: bool) -> bool:
+    return isinstance(expr, ast.Constant) and expr.value is value
+
+
 class DopplerFrame(ASTFrame):
     """
     Perform redshift on a W_ASTFunc
@@ -147,15 +151,23 @@ class DopplerFrame(ASTFrame):
         newtest = self.eval_and_shift(if_node.test, varname='@if')
         newthen = self.shift_body(if_node.then_body)
         newelse = self.shift_body(if_node.else_body)
+        # if the test is blue, we know statically which branch is taken. Note
+        # that we still need to shift both bodies, to typecheck them
+        if is_const_bool(newtest, True):
+            return newthen
+        elif is_const_bool(newtest, False):
+            return newelse
         return [if_node.replace(
             test = newtest,
             then_body = newthen,
             else_body = newelse
         )]
 
-    def shift_stmt_While(self, while_node: ast.While) -> list[ast.While]:
+    def shift_stmt_While(self, while_node: ast.While) -> list[ast.Stmt]:
         newtest = self.eval_and_shift(while_node.test, varname='@while')
         newbody = self.shift_body(while_node.body)
+        if is_const_bool(newtest, False):
+            return []
         return [while_node.replace(
             test = newtest,
             body = newbody
@@ -70,79 +70,105 @@ import re
 PARTS = Sequence[Union[str, 'NSPart']]
 QUALIFIERS = Optional[Sequence[Union[str, 'FQN']]]
 
+_DOT_TO_UNDERSCORE = str.maketrans('.', '_')
+
 def get_parts(x: PARTS) -> list['NSPart']:
-    parts = []
-    for part in x:
-        if isinstance(part, str):
-            parts.append(NSPart(part, []))
-        elif isinstance(part, NSPart):
-            parts.append(part)
-        else:
-            assert False
-    return parts
+    return [NSPart(part) if isinstance(part, str) else part for part in x]
 
 def get_qualifiers(x: QUALIFIERS) -> list['FQN']:
-    x = x or []
-    quals = []
-    for item in x:
-        if isinstance(item, str):
-            quals.append(FQN(item))
-        elif isinstance(item, FQN):
-            quals.append(item)
-        else:
-            assert False
-    return quals
+    if not x:
+        return []
+    return [FQN(item) if isinstance(item, str) else item for item in x]
 
 @dataclass
 class NSPart:
+    __slots__ = ('name', 'qualifiers', '_str', '_c_name')
     name: str
     qualifiers: list['FQN']
 
     def __init__(self, name: str, quals: QUALIFIERS=None) -> None:
         self.name = name
-        self.qualifiers = get_qualifiers(quals)
+        if quals:
+            self.qualifiers = get_qualifiers(quals)
+        else:
+            self.qualifiers = []
+        self._str: Optional[str] = None
+        self._c_name: Optional[str] = None
 
     def __str__(self) -> str:
-        if len(self.qualifiers) == 0:
-            return self.name
-        else:
-            quals = ', '.join(q.human_name for q in self.qualifiers)
-            return f'{self.name}[{quals}]'
+        # NSParts are never mutated after construction, so we can cache it
+        if self._str is None:
+            if len(self.qualifiers) == 0:
+                self._str = self.name
+            else:
+                quals = ', '.join(q.human_name for q in self.qualifiers)
+                self._str = f'{self.name}[{quals}]'
+        return self._str
 
     @property
     def c_name(self) -> str:
-        name = self.name.replace('.', '_')
-        if len(self.qualifiers) == 0:
-            return name
-        else:
-            quals = '_'.join(fqn.c_name_plain for fqn in self.qualifiers)
-            return f'{name}__{quals}'
+        if self._c_name is None:
+            name = self.name
+            if '.' in name:
+                name = name.translate(_DOT_TO_UNDERSCORE)
+            if len(self.qualifiers) == 0:
+                self._c_name = name
+            else:
+                quals = '_'.join(fqn.c_name_plain for fqn in self.qualifiers)
+                self._c_name = f'{name}__{quals}'
+        return self._c_name
 
 
 class FQN:
+    """
+    FQNs are immutable: .parts and .suffix must never be modified after
+    construction. This allows us to compute .fullname and the hash lazily,
+    and to cache them.
+    """
+    __slots__ = ('parts', 'suffix', '_fullname_cache', '_hash_cache',
+                 '_human_name_cache', '_c_name_plain_cache')
     parts: list[NSPart]
     suffix: str
+    _fullname_cache: Optional[str]
+    _hash_cache: Optional[int]
+    _human_name_cache: Optional[str]
+    _c_name_plain_cache: Optional[str]
 
     def __new__(cls, x: str | PARTS, *, suffix: str = '') -> 'FQN':
         """
         Supported overloads:
             FQN(x: str)
             FQN(x: PARTS, *, suffix='')
+
+        Whitespace is allowed only around the separators: a name which
+        contains whitespace, like 'a b', is rejected with ValueError.
         """
-        from .fqn_parser import FQNParser
         if isinstance(x, str):
             assert suffix == ''
-            return FQNParser(x).parse()
+            if _SIMPLE_FQN_RE.fullmatch(x):
+                return FQN(x.split('::'))
+            from .fqn_parser import parse_fqn_string
+            return parse_fqn_string(x)
         else:
-            fqn = super().__new__(cls)
-            fqn.parts = get_parts(x)
-            fqn.suffix = suffix
-            return fqn
+            return cls._from_parts(get_parts(x), suffix)
+
+    @classmethod
+    def _from_parts(cls, parts: list[NSPart], suffix: str = '') -> 'FQN':
+        """
+        Internal constructor which skips get_parts(). The caller must pass a
+        fresh list containing only NSParts.
+        """
+        fqn = super().__new__(cls)
+        fqn.parts = parts
+        fqn.suffix = suffix
+        fqn._fullname_cache = None
+        fqn._hash_cache = None
+        fqn._human_name_cache = None
+        fqn._c_name_plain_cache = None
+        return fqn
 
     def with_suffix(self, suffix: str) -> 'FQN':
-        res = FQN(self.parts)
-        res.suffix = suffix
-        return res
+        return FQN._from_parts(self.parts[:], suffix)
 
     def __repr__(self) -> str:
         return f"FQN({self.fullname!r})"
@@ -151,18 +177,27 @@ class FQN:
         return self.fullname
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FQN):
             return NotImplemented
         return self.fullname == other.fullname
 
     def __hash__(self) -> int:
-        return hash(self.fullname)
+        if self._hash_cache is None:
+            self._hash_cache = hash(self.fullname)
+        return self._hash_cache
 
     def _fullname(self, human: bool) -> str:
         parts = self.parts
-        if human and str(parts[0]) == 'builtins':
-            parts = parts[1:]
-        s = '::'.join(str(part) for part in parts)
+        if human and parts:
+            p0 = parts[0]
+            if p0.name == 'builtins' and not p0.qualifiers:
+                parts = parts[1:]
+        if len(parts) == 1:
+            s = str(parts[0])
+        else:
+            s = '::'.join([str(part) for part in parts])
 
         if self.suffix != '':
             s += f'#{self.suffix}'
@@ -170,7 +205,9 @@ class FQN:
 
     @property
     def fullname(self) -> str:
-        return self._fullname(human=False)
+        if self._fullname_cache is None:
+            self._fullname_cache = self._fullname(human=False)
+        return self._fullname_cache
 
     @property
     def human_name(self) -> str:
@@ -178,6 +215,11 @@ class FQN:
         Like fullname, but doesn't show 'builtins::',
         and special-case 'def[...]'
         """
+        if self._human_name_cache is None:
+            self._human_name_cache = self._compute_human_name()
+        return self._human_name_cache
+
+    def _compute_human_name(self) -> str:
         is_def = (len(self.parts) == 2 and
                   self.modname == 'builtins' and
                   self.parts[1].name == 'def')
@@ -195,7 +237,7 @@ class FQN:
 
     @property
     def namespace(self) -> 'FQN':
-        return FQN(self.parts[:-1])
+        return FQN._from_parts(self.parts[:-1])
 
     @property
     def symbol_name(self) -> str:
@@ -205,8 +247,7 @@ class FQN:
         """
         Create a new FQN nested inside the current one.
         """
-        qual2 = get_qualifiers(qualifiers)
-        return FQN(self.parts + [NSPart(name, qual2)])
+        return FQN._from_parts(self.parts + [NSPart(name, qualifiers)])
 
     @property
     def c_name(self) -> str:
@@ -244,11 +285,12 @@ class FQN:
         """
         Like c_name, but without the spy_ prefix
         """
-        parts = [part.c_name for part in self.parts]
-        cn = '$'.join(parts)
-        if self.suffix != '':
-            cn += '$' + self.suffix
-        return cn
+        if self._c_name_plain_cache is None:
+            cn = '$'.join([part.c_name for part in self.parts])
+            if self.suffix != '':
+                cn += '$' + self.suffix
+            self._c_name_plain_cache = cn
+        return self._c_name_plain_cache
 
     @property
     def spy_name(self) -> str:
@@ -260,3 +302,11 @@ class FQN:
 
     def is_object(self) -> bool:
         return not self.is_module()
+
+
+# FQNs without qualifiers and suffix, e.g. "i32" or "a.b.c::foo". These are
+# by far the most common, and we can construct them without invoking the
+# full parser. This is at the end of the module because fqn_parser imports
+# FQN.
+from .fqn_parser import NAME_RE as _NAME_RE
+_SIMPLE_FQN_RE = re.compile(rf'{_NAME_RE}(?:::{_NAME_RE})*')
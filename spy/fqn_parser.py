@@ -1,127 +1,89 @@
 from typing import Optional
 import re
-from dataclasses import dataclass
+
+# A name is a sequence of any non-whitespace characters except the separators
+# '::', '[', ']', ',', '#' (a single ':' is allowed). It's also used by
+# FQN.__new__, which imports it from here: so it must be defined before
+# importing .fqn, to avoid troubles with the circular import.
+NAME_RE = r'(?:[^\s\[\],#:]|:(?!:))+'
+
 from .fqn import NSPart, FQN
 
 
+# A token is either one of the separators or a name. Whitespace between
+# tokens is skipped.
+_TOKEN_RE = re.compile(rf'::|[\[\],#]|{NAME_RE}')
+
 def tokenize(s: str) -> list[str]:
-    tokens = []
-    token = ''
-    depth = 0
-    i = 0
-    while i < len(s):
-        char = s[i]
-        if char.isspace():
+    return _TOKEN_RE.findall(s)
+
+
+def parse_fqn_string(s: str) -> FQN:
+    """
+    Parse the given string into an FQN.
+
+    The parser is a set of plain functions which take the list of tokens and
+    the current position, and return the parsed object together with the new
+    position.
+    """
+    tokens = tokenize(s)
+    fqn, i = _parse_fqn(tokens, 0)
+    if i < len(tokens):
+        raise ValueError(f'Unexpected token: {tokens[i]}')
+    return fqn
+
+def _peek(tokens: list[str], i: int) -> Optional[str]:
+    if i >= len(tokens):
+        return None
+    return tokens[i]
+
+def _expect(tokens: list[str], i: int, token: str) -> int:
+    tok = _peek(tokens, i)
+    if tok != token:
+        raise ValueError(f"Expected {token}, got {tok}")
+    return i + 1
+
+def _parse_fqn(tokens: list[str], i: int) -> tuple[FQN, int]:
+    parts = []
+    while True:
+        part, i = _parse_part(tokens, i)
+        parts.append(part)
+        if _peek(tokens, i) == '::':
             i += 1
-            continue
-        if char in '[],' and depth == 0:
-            if token:
-                tokens.append(token)
-                token = ''
-            tokens.append(char)
-        elif char == '[':
-            if token:
-                tokens.append(token)
-                token = ''
-            tokens.append(char)
-            depth += 1
-        elif char == ']':
-            if token:
-                tokens.append(token)
-                token = ''
-            tokens.append(char)
-            depth -= 1
-        elif char == ':' and i + 1 < len(s) and s[i + 1] == ':' and depth == 0:
-            if token:
-                tokens.append(token)
-                token = ''
-            tokens.append('::')
-            i += 1  # Skip the next ':'
-        elif char == '#' and depth == 0:
-            if token:
-                tokens.append(token)
-                token = ''
-            tokens.append('#')
-        else:
-            token += char
-        i += 1
-    if token:
-        tokens.append(token)
-    return tokens
-
-
-class FQNParser:
-    def __init__(self, s: str) -> None:
-        self.tokens = tokenize(s)
-        self.i = 0
-        self.level = 0
-
-    def peek(self) -> Optional[str]:
-        while self.i < len(self.tokens) and self.tokens[self.i].isspace():
-            self.i += 1
-        if self.i >= len(self.tokens):
-            return None
-        return self.tokens[self.i]
-
-    def parse(self) -> 'FQN':
-        fqn = self.parse_fqn()
-        if self.i < len(self.tokens):
-            tok = self.tokens[self.i]
-            raise ValueError(f'Unexpected token: {tok}')
-        return fqn
-
-    def parse_fqn(self) -> 'FQN':
-        parts = []
-        while True:
-            parts.append(self.parse_part())
-            if self.peek() == '::':
-                self.expect('::')
-            else:
-                break
-
-        if self.peek() == "#":
-            self.expect("#")
-            suffix = self.parse_suffix()
         else:
-            suffix = ''
+            break
 
-        return FQN(parts, suffix=suffix)
+    if _peek(tokens, i) == '#':
+        suffix, i = _parse_name(tokens, i + 1)
+    else:
+        suffix = ''
 
-    def parse_part(self) -> NSPart:
-        name = self.parse_name()
-        if self.peek() == '[':
-            self.expect('[')
-            qualifiers = self.parse_qualifiers()
-            self.expect(']')
-            return NSPart(name, qualifiers)
-        else:
-            return NSPart(name, [])
-
-    def parse_qualifiers(self) -> list['FQN']:
-        qualifiers = []
-        while True:
-            qualifiers.append(self.parse_fqn())
-            if self.peek() is None:
-                raise ValueError('Unclosed bracket')
-            elif self.peek() == ',':
-                self.expect(',')
-            elif self.peek() == ']':
-                break
-        return qualifiers
-
-    def parse_name(self) -> str:
-        name = self.peek()
-        self.i += 1
-        assert name is not None
-        return name
-
-    def parse_suffix(self) -> str:
-        suffix = self.peek()
-        self.i += 1
-        assert suffix is not None
-        return suffix
-
-    def expect(self, token: str) -> None:
-        if self.peek() != token:
-            raise ValueError(f"Expected {token}, got {self.peek()}")
-        self.i += 1
+    return FQN(parts, suffix=suffix), i
+
+def _parse_part(tokens: list[str], i: int) -> tuple[NSPart, int]:
+    name, i = _parse_name(tokens, i)
+    if _peek(tokens, i) == '[':
+        qualifiers, i = _parse_qualifiers(tokens, i + 1)
+        i = _expect(tokens, i, ']')
+        return NSPart(name, qualifiers), i
+    else:
+        return NSPart(name, []), i
+
+def _parse_qualifiers(tokens: list[str], i: int) -> tuple[list[FQN], int]:
+    qualifiers = []
+    while True:
+        fqn, i = _parse_fqn(tokens, i)
+        qualifiers.append(fqn)
+        tok = _peek(tokens, i)
+        if tok is None:
+            raise ValueError('Unclosed bracket')
+        elif tok == ',':
+            i += 1
+        elif tok == ']':
+            break
+    return qualifiers, i
+
+def _parse_name(tokens: list[str], i: int) -> tuple[str, int]:
+    name = _peek(tokens, i)
+    assert name is not None
+    return name, i + 1
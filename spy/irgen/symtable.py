@@ -1,5 +1,5 @@
 from typing import Optional, Literal, TYPE_CHECKING, Any
-from dataclasses import dataclass, KW_ONLY, replace
+from dataclasses import dataclass, field, KW_ONLY, replace
 from spy.fqn import FQN
 from spy.location import Loc
 from spy.errors import SPyScopeError
@@ -40,16 +40,17 @@ class Symbol:
     level: int
     fqn: Optional[FQN] = None
 
-    def replace(self, **kwargs: Any) -> 'Symbol':
-        return replace(self, **kwargs)
+    # precomputed from level and fqn: they are queried on every name lookup
+    # and assignment, so we don't want to recompute them each time
+    is_local: bool = field(init=False, repr=False, compare=False)
+    is_global: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_local(self) -> bool:
-        return self.level == 0
+    def __post_init__(self) -> None:
+        self.is_local = self.level == 0
+        self.is_global = self.level != 0 and self.fqn is not None
 
-    @property
-    def is_global(self) -> bool:
-        return self.level != 0 and self.fqn is not None
+    def replace(self, **kwargs: Any) -> 'Symbol':
+        return replace(self, **kwargs)
 
 class SymTable:
     """
@@ -12,4 +12,8 @@ static inline spy_GcRef spy_GcAlloc(size_t size) {
     return (spy_GcRef){malloc(size)};
 }
 
+static inline spy_GcRef spy_GcAllocZeroed(size_t size) {
+    return (spy_GcRef){calloc(size, 1)};
+}
+
 #endif /* SPY_GC_H */
@@ -39,6 +39,10 @@ WASM_EXPORT(spy_gc_alloc_mem)(size_t size);
         spy_GcRef ref = spy_GcAlloc(sizeof(T) * n);              \
         return ( PTR ){ ref.p };                                 \
     }                                                            \
+    static inline PTR PTR##$gc_alloc_zeroed(size_t n) {          \
+        spy_GcRef ref = spy_GcAllocZeroed(sizeof(T) * n);        \
+        return ( PTR ){ ref.p };                                 \
+    }                                                            \
     static inline T PTR##$load(PTR p, size_t i) {                \
         return p.p[i];                                           \
     }                                                            \
@@ -64,6 +68,10 @@ WASM_EXPORT(spy_gc_alloc_mem)(size_t size);
         spy_GcRef ref = spy_GcAlloc(sizeof(T) * n);              \
         return ( PTR ){ ref.p, n };                              \
     }                                                            \
+    static inline PTR PTR##$gc_alloc_zeroed(size_t n) {          \
+        spy_GcRef ref = spy_GcAllocZeroed(sizeof(T) * n);        \
+        return ( PTR ){ ref.p, n };                              \
+    }                                                            \
     static inline T PTR##$load(PTR p, size_t i) {                \
         if (i >= p.length)                                       \
             spy_panic("ptr_load out of bounds");                 \
@@ -33,7 +33,10 @@ import ast as py_ast
 from tokenize import tokenize, NUMBER, STRING, NAME, OP, TokenInfo
 from io import BytesIO
 from spy.vendored import untokenize
-import spy.ast_dump
+# don't remove this import even if it looks unused: spy.ast monkey-patches
+# py_ast.AST to add .pp() and .compute_all_locs(), which are used on the
+# modules returned by magic_py_parse (e.g. by 'spy --pyparse')
+import spy.ast
 
 @dataclass(frozen=True)
 class LocInfo:
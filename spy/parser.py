@@ -1,6 +1,6 @@
 from typing import Optional, NoReturn, Any
 from types import NoneType
-import textwrap
+import functools
 import ast as py_ast
 import spy.ast
 from spy.magic_py_parse import magic_py_parse
@@ -9,6 +9,16 @@ from spy.location import Loc
 from spy.errors import SPyError, SPyParseError
 from spy.util import magic_dispatch
 
+@functools.lru_cache(maxsize=128)
+def cached_py_parse(src: str) -> py_ast.Module:
+    """
+    Memoized version of magic_py_parse.
+
+    It is safe to share the resulting py_ast between Parsers: the only thing
+    which we mutate is .loc, which Parser.parse() recomputes every time.
+    """
+    return magic_py_parse(src)
+
 def is_py_Name(py_expr: py_ast.expr, expected: str) -> bool:
     return isinstance(py_expr, py_ast.Name) and py_expr.id == expected
 
@@ -40,7 +50,7 @@ class Parser:
         return Parser(src, filename)
 
     def parse(self) -> spy.ast.Module:
-        py_mod = magic_py_parse(self.src)
+        py_mod = cached_py_parse(self.src)
         assert isinstance(py_mod, py_ast.Module)
         py_mod.compute_all_locs(self.filename)
         return self.from_py_Module(py_mod)
@@ -112,7 +122,7 @@ class Parser:
         if py_returns:
             return_type = self.from_py_expr(py_returns)
         elif color == 'blue':
-            return_type = spy.ast.Name(py_funcdef.loc, 'dynamic')
+            return_type = spy.ast.Name(loc, 'dynamic')
         else:
             # create a loc which points to the 'def foo' part. This is a bit
             # wrong, ideally we would like it to point to the END of the
@@ -125,9 +135,9 @@ class Parser:
         #
         body = self.from_py_body(py_funcdef.body)
         return spy.ast.FuncDef(
-            loc = py_funcdef.loc,
+            loc = loc,
             color = color,
-            name = py_funcdef.name,
+            name = name,
             args = args,
             return_type = return_type,
             body = body,
@@ -1,4 +1,5 @@
 import pytest
+import wasmtime
 from spy.fqn import FQN
 from spy.errors import SPyTypeError
 from spy.vm.b import B
@@ -570,6 +571,15 @@ class TestBasic(CompilerTest):
         assert mod.foo(10) == 10
         assert mod.foo(-20) == 20
 
+    def test_abs_overflow(self):
+        mod = self.compile("""
+        def foo(x: i32) -> i32:
+            return abs(x)
+        """)
+        # abs(INT_MIN) traps in libspy: check that the interpreter agrees
+        with pytest.raises(wasmtime.Trap):
+            mod.foo(-2147483648)
+
     def test_resolve_name(self):
         mod = self.compile("""
         from builtins import i32 as my_int
@@ -1,12 +1,20 @@
 #-*- encoding: utf-8 -*-
 
+from typing import Any
 import pytest
 from spy.errors import SPyPanicError
+from spy.fqn import FQN
 from spy.vm.b import B
+from spy.vm.object import W_Type
+from spy.vm.function import W_Func
 from spy.vm.modules.unsafe import UNSAFE
 from spy.vm.modules.unsafe.ptr import W_Ptr
+from spy.vm.modules.unsafe.mem import GC_ALLOC_CHUNK, GC_ALLOC_MAX_POOLED
+from spy.vm.modules.unsafe.misc import sizeof
+from spy.vm.modules.unsafe.struct import W_StructType
 from spy.backend.c.wrapper import WasmPtr
-from spy.tests.support import CompilerTest, no_C, expect_errors, only_interp
+from spy.tests.support import (CompilerTest, no_C, expect_errors, only_interp,
+                               only_C)
 
 class TestUnsafe(CompilerTest):
 
@@ -50,6 +58,115 @@ class TestUnsafe(CompilerTest):
         assert mod.bar(1) == 3.4
         assert mod.bar(2) == 5.6
 
+    def test_gc_alloc_zeroed(self):
+        mod = self.compile(
+        """
+        from unsafe import gc_alloc_zeroed, ptr
+
+        @struct
+        class Point:
+            x: i32
+            y: f64
+
+        def foo() -> f64:
+            p = gc_alloc_zeroed(Point)(2)
+            q = gc_alloc_zeroed(i32)(3)
+            return p.x + p.y + q[0] + q[1] + q[2]
+        """)
+        assert mod.foo() == 0.0
+
+    @only_interp
+    def test_gc_alloc_zeroed_clears_memory(self):
+        vm = self.vm
+        # fresh memory is already zero: dirty the exact block which the next
+        # allocation returns, i.e. the one right after p in the same chunk
+        def alloc_on_dirty_memory(w_gc_alloc: W_Func) -> bytes:
+            w_fn = vm.fast_call(w_gc_alloc, [B.w_i32])
+            assert isinstance(w_fn, W_Func)
+            w_p = vm.fast_call(w_fn, [vm.wrap(1)])
+            assert isinstance(w_p, W_Ptr)
+            addr = w_p.addr + 8
+            vm.ll.mem.write(addr, b'\xff' * 16)
+            w_q = vm.fast_call(w_fn, [vm.wrap(4)])
+            assert isinstance(w_q, W_Ptr)
+            assert w_q.addr == addr
+            return bytes(vm.ll.mem.read(addr, 16))
+        #
+        assert alloc_on_dirty_memory(UNSAFE.w_gc_alloc) == b'\xff' * 16
+        assert alloc_on_dirty_memory(UNSAFE.w_gc_alloc_zeroed) == bytes(16)
+
+    def record_gc_alloc_mem(self, monkeypatch: Any) -> list[int]:
+        """
+        Record the size of each block requested to spy_gc_alloc_mem.
+
+        It must be called before gc_alloc[T] is created, because it looks up
+        vm.ll.call only once.
+        """
+        sizes = []
+        ll_call = self.vm.ll.call
+        def call(name: str, *args: Any) -> Any:
+            if name == 'spy_gc_alloc_mem':
+                sizes.append(args[0])
+            return ll_call(name, *args)
+        monkeypatch.setattr(self.vm.ll, 'call', call)
+        return sizes
+
+    def gc_alloc(self, w_T: W_Type, n: int) -> W_Ptr:
+        w_fn = self.vm.fast_call(UNSAFE.w_gc_alloc, [w_T])
+        assert isinstance(w_fn, W_Func)
+        w_ptr = self.vm.fast_call(w_fn, [self.vm.wrap(n)])
+        assert isinstance(w_ptr, W_Ptr)
+        return w_ptr
+
+    @only_interp
+    def test_gc_alloc_pool(self, monkeypatch: Any) -> None:
+        self.compile(
+        """
+        @struct
+        class Point:
+            x: i32
+            y: f64
+        """)
+        w_Point = self.vm.lookup_global(FQN('test::Point'))
+        assert isinstance(w_Point, W_Type)
+        sizes = self.record_gc_alloc_mem(monkeypatch)
+        # allocate enough memory to refill the chunks a few times, mixing
+        # different item types and sizes
+        blocks = []
+        for i in range(60):
+            for w_T, n in [(B.w_i32, 1000), (B.w_i32, 3), (B.w_f64, 5),
+                           (w_Point, 7), (B.w_i32, 0)]:
+                w_ptr = self.gc_alloc(w_T, n)
+                assert w_ptr.length == n
+                size = sizeof(w_T) * n
+                blocks.append((w_ptr.addr, size))
+        # each gc_alloc[T] has its own chunk, the one of i32 was refilled
+        assert sizes.count(GC_ALLOC_CHUNK) > 4
+        # the only other calls are the ones for the empty blocks
+        assert sorted(set(sizes)) == [0, GC_ALLOC_CHUNK]
+        #
+        for addr, size in blocks:
+            assert addr % 8 == 0
+        blocks.sort()
+        for (addr1, size1), (addr2, size2) in zip(blocks, blocks[1:]):
+            assert addr1 + size1 <= addr2
+
+    @only_interp
+    def test_gc_alloc_big(self, monkeypatch: Any) -> None:
+        sizes = self.record_gc_alloc_mem(monkeypatch)
+        # big blocks don't go through the chunks
+        n = GC_ALLOC_MAX_POOLED // 4 + 1
+        w_ptr = self.gc_alloc(B.w_i32, n)
+        assert w_ptr.length == n
+        assert sizes == [n * 4]
+        w_ptr2 = self.gc_alloc(B.w_i32, n)
+        assert sizes == [n * 4, n * 4]
+        assert w_ptr.addr + n * 4 <= w_ptr2.addr
+        # but the small ones still do
+        self.gc_alloc(B.w_i32, 1)
+        self.gc_alloc(B.w_i32, 1)
+        assert sizes == [n * 4, n * 4, GC_ALLOC_CHUNK]
+
     def test_out_of_bound(self):
         mod = self.compile(
         """
@@ -88,6 +205,30 @@ class TestUnsafe(CompilerTest):
         """)
         assert mod.foo(3, 4.5) == 7.5
 
+    @only_C
+    def test_struct_array(self):
+        mod = self.compile(
+        """
+        from unsafe import gc_alloc, ptr
+
+        @struct
+        class Point:
+            x: i32
+            y: f64
+
+        def foo(x: i32, y: f64) -> f64:
+            p = gc_alloc(Point)(1)
+            p.x = x
+            p.y = y
+            # copy the struct by value in and out of the array
+            arr = gc_alloc(Point)(2)
+            arr[1] = p[0]
+            q = gc_alloc(Point)(1)
+            q[0] = arr[1]
+            return q.x + q.y
+        """)
+        assert mod.foo(3, 4.5) == 7.5
+
     def test_struct_wrong_field(self):
         src = """
         from unsafe import ptr, gc_alloc
@@ -141,6 +282,48 @@ class TestUnsafe(CompilerTest):
         """)
         assert mod.foo() == 4321
 
+    @only_interp
+    def test_struct_layout(self):
+        self.compile(
+        """
+        from unsafe import ptr
+
+        @struct
+        class A:
+            x: i32
+            y: f64
+            z: i32
+
+        @struct
+        class B:
+            a: i32
+            b: i32
+            c: i32
+
+        @struct
+        class C:
+            x: i32
+            b: B
+            p: ptr[i32]
+        """)
+        w_A = self.vm.lookup_global(FQN('test::A'))
+        assert isinstance(w_A, W_StructType)
+        assert w_A.offsets == {'x': 0, 'y': 8, 'z': 16}
+        assert w_A.size == 24
+        assert w_A.align == 8
+        #
+        w_B = self.vm.lookup_global(FQN('test::B'))
+        assert isinstance(w_B, W_StructType)
+        assert w_B.offsets == {'a': 0, 'b': 4, 'c': 8}
+        assert w_B.size == 12
+        assert w_B.align == 4
+        #
+        w_C = self.vm.lookup_global(FQN('test::C'))
+        assert isinstance(w_C, W_StructType)
+        assert w_C.offsets == {'x': 0, 'b': 4, 'p': 16}
+        assert w_C.size == 24
+        assert w_C.align == 4
+
     def test_ptr_eq(self):
         mod = self.compile("""
         from unsafe import gc_alloc, ptr
@@ -43,6 +43,23 @@ class TestDoppler:
             return 3
         """)
 
+    def test_fold_nested_and_compare(self):
+        src = """
+        def foo() -> i32:
+            return (1 + 2) * (3 + 4)
+
+        def bar() -> bool:
+            return 1 + 2 * 3 < 10
+        """
+        self.redshift(src)
+        self.assert_dump("""
+        def foo() -> i32:
+            return 21
+
+        def bar() -> bool:
+            return True
+        """)
+
     def test_red_vars(self):
         src = """
         def foo() -> i32:
@@ -237,3 +254,44 @@ class TestDoppler:
             if `operator::i32_to_bool`(x):
                 pass
         """)
+
+    def test_fold_blue_if_and_while(self):
+        src = """
+        def foo() -> i32:
+            x: i32 = 0
+            if 1 < 2:
+                x = 1
+            else:
+                x = 2
+            if 1 > 2:
+                x = 3
+            while 1 > 2:
+                x = 4
+            return x
+        """
+        self.redshift(src)
+        self.assert_dump("""
+        def foo() -> i32:
+            x: i32
+            x = 0
+            x = 1
+            return x
+        """)
+
+    def test_ptr_to_struct(self):
+        src = """
+        from unsafe import ptr
+
+        @struct
+        class Point:
+            x: i32
+            y: f64
+
+        def foo(p: ptr[Point], q: ptr[Point]) -> void:
+            q[0] = p[1]
+        """
+        self.redshift(src)
+        self.assert_dump("""
+        def foo(p: `unsafe::ptr[test::Point]`, q: `unsafe::ptr[test::Point]`) -> void:
+            `unsafe::ptr[test::Point]::store`(q, 0, `unsafe::ptr[test::Point]::load`(p, 1))
+        """)
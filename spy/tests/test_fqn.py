@@ -90,3 +90,23 @@ def test_FQN_human_name():
     func = FQN("builtins").join('def', ['builtins::i32', 'builtins::f64',
                                         'builtins::str'])
     assert func.human_name == 'def(i32, f64) -> str'
+
+def test_FQN_with_suffix():
+    a = FQN("aaa::bbb")
+    assert a.fullname == "aaa::bbb"
+    b = a.with_suffix('1')
+    assert b.fullname == "aaa::bbb#1"
+    assert a.fullname == "aaa::bbb"
+    assert a != b
+    assert hash(b) == hash(FQN("aaa::bbb#1"))
+
+def test_FQN_namespace():
+    a = FQN("aaa::bbb")
+    assert a.namespace == FQN("aaa")
+    assert a.symbol_name == "bbb"
+    # the namespace of a top-level name is empty
+    ns = FQN("a").namespace
+    assert ns.parts == []
+    assert ns.fullname == ""
+    assert ns == FQN("a").namespace
+    assert hash(ns) == hash(FQN("a").namespace)
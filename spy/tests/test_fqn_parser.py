@@ -6,6 +6,19 @@ def test_tokenizer():
     assert tokenize("mod::foo") == ["mod", "::", "foo"]
     assert tokenize("a.b.c::") == ["a.b.c", "::"]
     assert tokenize("list[i32]") == ["list", "[", "i32", "]"]
+    assert tokenize("dict[str, unsafe::ptr[i32]]#1") == [
+        "dict", "[", "str", ",", "unsafe", "::", "ptr", "[", "i32", "]", "]",
+        "#", "1"
+    ]
+
+def test_whitespace():
+    assert FQN(" mod :: foo ").fullname == "mod::foo"
+    assert FQN("list[ i32 ]").fullname == "list[i32]"
+    # names cannot contain whitespace
+    with pytest.raises(ValueError, match="Unexpected token: b"):
+        FQN("a b")
+    with pytest.raises(ValueError, match="Unexpected token: c"):
+        FQN("a::b c")
 
 def test_single_unqualified_part():
     fqn = FQN("foo")
@@ -54,3 +67,10 @@ def test_suffix():
     assert fqn.parts[1].qualifiers[0].parts[0].name == "i32"
     assert fqn.suffix == '1'
     assert str(fqn) == "mod::foo[i32]#1"
+
+def test_simple_fqn_fast_path():
+    from spy.fqn_parser import parse_fqn_string
+    for s in ["foo", "mod::foo", "a.b.c::foo", "a::b::c"]:
+        fqn = FQN(s)
+        assert fqn.parts == parse_fqn_string(s).parts
+        assert fqn.fullname == s
@@ -37,6 +37,13 @@ class TestParser:
             print_diff(expected, dumped, 'expected', 'got')
             pytest.fail("assert_dump failed")
 
+    def test_parse_same_src_different_filenames(self):
+        src = "def foo() -> void:\n    pass\n"
+        mod1 = Parser(src, 'a.spy').parse()
+        mod2 = Parser(src, 'b.spy').parse()
+        assert mod1.get_funcdef('foo').loc.filename == 'a.spy'
+        assert mod2.get_funcdef('foo').loc.filename == 'b.spy'
+
     def test_Module(self):
         mod = self.parse("""
         def foo() -> void:
@@ -42,6 +42,23 @@ def test_magic_dispatch_NotImplemented():
     assert f.visit(4, 5) == 9
     assert f.visit('world', 42) == 'hello NotImplemented world 42'
 
+def test_magic_dispatch_cache():
+    class Foo:
+        def visit(self, obj: Any) -> Any:
+            return magic_dispatch(self, 'visit', obj)
+
+        def visit_int(self, x: int) -> str:
+            return 'Foo'
+
+    class Bar(Foo):
+        def visit_int(self, x: int) -> str:
+            return 'Bar'
+
+    # the dispatch is cached per-class: make sure that we don't mix them up
+    for i in range(2):
+        assert Foo().visit(1) == 'Foo'
+        assert Bar().visit(1) == 'Bar'
+
 
 def test_extend():
     class Foo:
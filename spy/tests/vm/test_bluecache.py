@@ -0,0 +1,22 @@
+from spy.vm.vm import SPyVM
+from spy.vm.b import B
+from spy.vm.function import W_Func
+
+class TestBlueCache:
+
+    def test_lookup(self):
+        vm = SPyVM()
+        w_func = B.w_abs
+        assert isinstance(w_func, W_Func)
+        bc = vm.bluecache
+        w_x = vm.wrap(42)
+        w_res = vm.wrap('hello')
+        bc.record(w_func, [w_x], w_res)
+        # same arguments: this is served by the by_identity index
+        assert bc.lookup(w_func, [w_x]) is w_res
+        # equal but non-identical arguments must hit the same entry
+        w_y = vm.wrap(42)
+        assert w_y is not w_x
+        assert bc.lookup(w_func, [w_y]) is w_res
+        assert bc.lookup(w_func, [vm.wrap(43)]) is None
+        assert bc.lookup(w_func, [w_x, w_y]) is None
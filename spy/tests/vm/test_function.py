@@ -1,10 +1,12 @@
+import gc
+import weakref
 import pytest
 from typing import no_type_check
 from spy.fqn import FQN
 from spy.vm.primitive import W_I32
 from spy.vm.vm import SPyVM
 from spy.vm.b import B
-from spy.vm.w import W_FuncType
+from spy.vm.w import W_FuncType, W_Type
 from spy.vm.function import W_ASTFunc
 
 class TestFunction:
@@ -26,14 +28,34 @@ class TestFunction:
                                            y=B.w_i32,
                                            w_restype=B.w_i32)
 
+    def test_FunctionType_parse_invalid(self):
+        with pytest.raises(AssertionError, match='Invalid param'):
+            W_FuncType.parse('def(x i32) -> i32')
+        with pytest.raises(AssertionError, match='Invalid param'):
+            W_FuncType.parse('def(x: i32, y) -> i32')
+        with pytest.raises(AssertionError, match='Invalid functype'):
+            W_FuncType.parse('def(x: i32) i32')
+
     def test_FunctionType_eq(self):
         vm = SPyVM()
         w_ft1 = W_FuncType.parse('def() -> i32')
         w_ft2 = W_FuncType.parse('def() -> i32')
-        assert w_ft1 is not w_ft2
-        assert w_ft1 == w_ft2
-        w_res = vm.eq(w_ft1, w_ft2)
-        assert w_res is B.w_True
+        assert w_ft1 is w_ft2  # functypes are interned
+        assert vm.eq(w_ft1, w_ft2) is B.w_True
+        w_ft3 = W_FuncType.parse('def() -> f64')
+        assert w_ft1 != w_ft3
+        assert vm.eq(w_ft1, w_ft3) is B.w_False
+
+    def test_FunctionType_interning_does_not_leak(self):
+        # e.g. struct types belong to a VM, the intern table must not keep
+        # them alive
+        w_T = W_Type.declare(FQN('test::T'))
+        w_ft = W_FuncType.make(x=w_T, w_restype=B.w_i32)
+        assert W_FuncType.make(x=w_T, w_restype=B.w_i32) is w_ft
+        ref = weakref.ref(w_T)
+        del w_T, w_ft
+        gc.collect()
+        assert ref() is None
 
     @no_type_check
     def test_function_eq(self):
@@ -98,6 +98,34 @@ class TestVM:
         assert vm.issubclass(w_b, w_a)
         assert not vm.issubclass(w_a, w_b)
 
+    def test_issubclass_new_types(self):
+        # vm.issubclass caches its results: check that they are still correct
+        # for types which are created after the first lookup
+        @builtin_type('test', 'A')
+        class W_A(W_Object):
+            pass
+        #
+        vm = SPyVM()
+        w_a = W_A._w
+        assert vm.issubclass(w_a, B.w_object)
+        assert not vm.issubclass(B.w_object, w_a)
+        #
+        @builtin_type('test', 'B')
+        class W_B(W_A):
+            pass
+        #
+        @builtin_type('test', 'C')
+        class W_C(W_Object):
+            pass
+        #
+        w_b = W_B._w
+        w_c = W_C._w
+        assert vm.issubclass(w_b, w_a)
+        assert vm.issubclass(w_b, B.w_object)
+        assert not vm.issubclass(w_a, w_b)
+        assert not vm.issubclass(w_c, w_a)
+        assert not vm.issubclass(w_b, w_c)
+
     def test_union_type(self):
         @builtin_type('test', 'A')
         class W_A(W_Object):
@@ -244,3 +272,20 @@ class TestVM:
         assert vm.lookup_global(fqn) is w_x
         with pytest.raises(ValueError, match="'builtins::x' already exists"):
             vm.add_global(fqn, vm.wrap(43))
+
+    def test_reverse_lookup_global_stale(self):
+        vm = SPyVM()
+        fqn_a = FQN('builtins::a')
+        fqn_b = FQN('builtins::b')
+        w_x = W_Object()
+        w_y = W_Object()
+        vm.add_global(fqn_a, w_x)
+        vm.add_global(fqn_b, w_x)
+        assert vm.reverse_lookup_global(w_x) == fqn_a
+        # replace the value of 'a': the entry for w_x is now stale and
+        # must not be returned anymore
+        vm.store_global(fqn_a, w_y)
+        assert vm.reverse_lookup_global(w_x) == fqn_b
+        assert vm.reverse_lookup_global(w_y) == fqn_a
+        vm.store_global(fqn_b, w_y)
+        assert vm.reverse_lookup_global(w_x) is None
@@ -91,19 +91,26 @@ class TextBuilder:
     wb = writeblock
 
     def build(self) -> str:
-        strlines = []
+        strlines: list[str] = []
+        self._collect_lines(strlines)
+        return '\n'.join(strlines)
+
+    def _collect_lines(self, strlines: list[str]) -> None:
+        """
+        Append all our lines to strlines, recursively flattening the nested
+        builders. This way, build() does a single join at the end, instead of
+        building an intermediate string for each nested builder.
+        """
         for line in self.lines:
             if isinstance(line, TextBuilder):
-                line = line.build()
-                if line == '':
-                    continue # nothing to do
-                else:
-                    assert line.endswith('\n')
-                    line = line[:-1]
-                    strlines.append(line)
+                line._collect_lines(strlines)
+                # the content of a nested builder must end with a newline,
+                # i.e. its last line must be empty: drop it, because the
+                # newline is already provided by the outer builder
+                last = strlines.pop()
+                assert last == ''
             else:
                 strlines.append(line)
-        return '\n'.join(strlines)
 
 
 class ColorFormatter:
@@ -15,6 +15,10 @@ class AnythingClass:
 ANYTHING: typing.Any = AnythingClass()
 
 
+# (visitor class, prefix, node class) -> unbound method. Filled lazily by
+# magic_dispatch, so that the lookup by name happens only once per key.
+_DISPATCH_CACHE: dict[tuple[type, str, type], typing.Callable] = {}
+
 @typing.no_type_check
 def magic_dispatch(self, prefix, obj, *args, **kwargs):
     """
@@ -31,14 +35,22 @@ def magic_dispatch(self, prefix, obj, *args, **kwargs):
         def visit_str(self): ...
         def visit_float(self): ...
     """
-    methname = f'{prefix}_{obj.__class__.__name__}'
-    meth = getattr(self, methname, None)
+    key = (self.__class__, prefix, obj.__class__)
+    meth = _DISPATCH_CACHE.get(key)
+    if meth is None:
+        meth = _DISPATCH_CACHE[key] = _lookup_dispatch(*key)
+    return meth(self, obj, *args, **kwargs)
+
+@typing.no_type_check
+def _lookup_dispatch(cls, prefix, objcls):
+    methname = f'{prefix}_{objcls.__name__}'
+    meth = getattr(cls, methname, None)
     if meth is None:
-        meth = getattr(self, f'{prefix}_NotImplemented', None)
+        meth = getattr(cls, f'{prefix}_NotImplemented', None)
         if meth is None:
-            clsname = self.__class__.__name__
+            clsname = cls.__name__
             raise NotImplementedError(f'{clsname}.{methname}')
-    return meth(obj, *args, **kwargs)
+    return meth
 
 
 @typing.no_type_check
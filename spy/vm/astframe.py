@@ -337,20 +337,28 @@ class AbstractFrame:
         wop_cond = self.eval_expr(if_node.test, varname='@if')
         assert isinstance(wop_cond.w_val, W_Bool)
         if self.vm.is_True(wop_cond.w_val):
-            for stmt in if_node.then_body:
-                self.exec_stmt(stmt)
+            body = if_node.then_body
         else:
-            for stmt in if_node.else_body:
-                self.exec_stmt(stmt)
+            body = if_node.else_body
+        exec_stmt = self.exec_stmt
+        for stmt in body:
+            exec_stmt(stmt)
 
     def exec_stmt_While(self, while_node: ast.While) -> None:
+        # this is the hottest loop of the interpreter: bind everything we
+        # need to locals once
+        test = while_node.test
+        body = while_node.body
+        eval_expr = self.eval_expr
+        exec_stmt = self.exec_stmt
+        is_False = self.vm.is_False
         while True:
-            wop_cond = self.eval_expr(while_node.test, varname='@while')
+            wop_cond = eval_expr(test, varname='@while')
             assert isinstance(wop_cond.w_val, W_Bool)
-            if self.vm.is_False(wop_cond.w_val):
+            if is_False(wop_cond.w_val):
                 break
-            for stmt in while_node.body:
-                self.exec_stmt(stmt)
+            for stmt in body:
+                exec_stmt(stmt)
 
     # ==== expressions ====
 
@@ -433,14 +441,12 @@ class AbstractFrame:
 
     def eval_expr_BinOp(self, binop: ast.BinOp) -> W_OpArg:
         w_OP = OP_from_token(binop.op) # e.g., w_ADD, w_MUL, etc.
-        wop_l = self.eval_expr(binop.left)
-        wop_r = self.eval_expr(binop.right)
-        w_opimpl = self.vm.call_OP(w_OP, [wop_l, wop_r])
-        return self.eval_opimpl(
-            binop,
-            w_opimpl,
-            [wop_l, wop_r]
-        )
+        eval_expr = self.eval_expr
+        wop_l = eval_expr(binop.left)
+        wop_r = eval_expr(binop.right)
+        args_wop = [wop_l, wop_r]
+        w_opimpl = self.vm.call_OP(w_OP, args_wop)
+        return self.eval_opimpl(binop, w_opimpl, args_wop)
 
     eval_expr_Add = eval_expr_BinOp
     eval_expr_Sub = eval_expr_BinOp
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 ARGS_W = Sequence[W_Object]
 ENTRY = tuple[ARGS_W, W_Object]
+IDKEY = tuple[W_Func, tuple[int, ...]]
 
 DEBUG = False
 
@@ -20,17 +21,27 @@ class BlueCache:
     list of calls, and then during lookup it does a linear search.
 
     We should use a SPy dict, as soon as we have it.
+
+    As a fast path, we also index the results by the identity of the
+    arguments: blue generic functions such as unsafe::mem_read are called
+    again and again with the very same W_Type (e.g. by ptr[i32].load), and
+    this avoids a linear search and a call to universal_eq for each entry.
     """
     vm: 'SPyVM'
     data: defaultdict[W_Func, list[ENTRY]]
+    by_identity: dict[IDKEY, W_Object]
 
     def __init__(self, vm: 'SPyVM'):
         self.vm = vm
         self.data = defaultdict(list)
+        self.by_identity = {}
 
     def record(self, w_func: W_Func, args_w: ARGS_W, w_result: W_Object) ->None:
         entry = (args_w, w_result)
         self.data[w_func].append(entry)
+        # args_w is kept alive by the entry, so its ids cannot be reused
+        idkey = (w_func, tuple(map(id, args_w)))
+        self.by_identity[idkey] = w_result
 
     def lookup(self, w_func: W_Func, got_args_w: ARGS_W) -> Optional[W_Object]:
         w_res = self._lookup(w_func, got_args_w)
@@ -39,6 +50,10 @@ class BlueCache:
         return w_res
 
     def _lookup(self, w_func: W_Func, got_args_w: ARGS_W) -> Optional[W_Object]:
+        idkey = (w_func, tuple(map(id, got_args_w)))
+        w_result = self.by_identity.get(idkey)
+        if w_result is not None:
+            return w_result
         entries = self.data[w_func]
         for args_w, w_result in entries:
             if self.args_w_eq(args_w, got_args_w):
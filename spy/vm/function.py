@@ -1,6 +1,8 @@
+import re
+from weakref import WeakValueDictionary
 from dataclasses import dataclass
 from typing import (TYPE_CHECKING, Any, Optional, Callable, Sequence, Literal,
-                    Iterator, Self)
+                    Iterator, Self, ClassVar, NamedTuple)
 from spy import ast
 from spy.location import Loc
 from spy.ast import Color
@@ -17,22 +19,46 @@ CLOSURE = tuple[Namespace, ...]
 
 FuncParamKind = Literal['simple', 'varargs']
 
-@dataclass(frozen=True, eq=True)
-class FuncParam:
+# used by W_FuncType.parse
+_FUNCTYPE_RE = re.compile(r'def\((.*)\)\s*->\s*(\w+)')
+_FUNCPARAM_RE = re.compile(r'\s*(\w+)\s*:\s*(\w+)\s*')
+
+class FuncParam(NamedTuple):
     name: str
     w_type: W_Type
     kind: FuncParamKind
 
 
-@dataclass(repr=False, eq=True)
+# W_FuncTypes are interned by W_FuncType.new, so they can be compared and
+# hashed by identity
+@dataclass(repr=False, eq=False)
 class W_FuncType(W_Type):
     color: Color
     params: list[FuncParam]
     w_restype: W_Type
 
+    # functypes are interned: typecheck_opimpl & co. ask for the same
+    # signatures over and over, and building a new W_Type is expensive.
+    #
+    # The table is global but keyed by per-VM types (e.g. structs and
+    # ptr[T]), so it holds its entries weakly: a functype stays interned as
+    # long as someone uses it, and goes away together with its VM.
+    _cache: ClassVar['WeakValueDictionary[tuple, W_FuncType]'] = (
+        WeakValueDictionary())
+
     @classmethod
     def new(cls, params: list[FuncParam], w_restype: W_Type,
             *, color: Color = 'red') -> 'Self':
+        key = (cls, tuple(params), w_restype, color)
+        w_functype = cls._cache.get(key)
+        if w_functype is None:
+            w_functype = cls._new(params, w_restype, color)
+            cls._cache[key] = w_functype
+        return w_functype  # type: ignore
+
+    @classmethod
+    def _new(cls, params: list[FuncParam], w_restype: W_Type,
+             color: Color) -> 'Self':
         # sanity check
         if params:
             assert isinstance(params[0], FuncParam)
@@ -63,9 +89,6 @@ class W_FuncType(W_Type):
     def __repr__(self) -> str:
         return f"<spy type '{self.signature}'>"
 
-    def __hash__(self) -> int:
-        return hash((self.fqn, self.color, tuple(self.params), self.w_restype))
-
     @builtin_method('__EQ__', color='blue')
     @staticmethod
     def w_EQ(vm: 'SPyVM', wop_l: 'W_OpArg', wop_r: 'W_OpArg') -> 'W_OpImpl':
@@ -107,15 +130,16 @@ class W_FuncType(W_Type):
                 return getattr(B, attr)
             assert False, f'Cannot find type {s}'
 
-        args, res = map(str.strip, s.split('->'))
-        assert args.startswith('def(')
-        assert args.endswith(')')
+        m = _FUNCTYPE_RE.fullmatch(s.strip())
+        assert m, f'Invalid functype: {s}'
+        arglist, res = m.groups()
         kwargs = {}
-        arglist = args[4:-1].split(',')
-        for arg in arglist:
+        for arg in arglist.split(','):
             if arg == '':
                 continue
-            argname, argtype = map(str.strip, arg.split(':'))
+            m = _FUNCPARAM_RE.fullmatch(arg)
+            assert m, f'Invalid param {arg!r} in functype: {s}'
+            argname, argtype = m.groups()
             kwargs[argname] = parse_type(argtype)
         #
         w_restype = parse_type(res)
@@ -162,6 +186,7 @@ W_FuncType._w = W_Type.declare(FQN('builtins::functype'))
 
 class W_Func(W_Object):
     __spy_storage_category__ = 'reference'
+    __slots__ = ('w_functype', 'fqn', 'def_loc')
 
     w_functype: W_FuncType
     fqn: FQN
@@ -221,6 +246,7 @@ class W_Func(W_Object):
 
 
 class W_ASTFunc(W_Func):
+    __slots__ = ('funcdef', 'closure', 'locals_types_w')
     funcdef: ast.FuncDef
     closure: tuple[Namespace, ...]
     # types of local variables: this is non-None IIF the function has been
@@ -266,23 +292,35 @@ class W_BuiltinFunc(W_Func):
     Builtin functions are implemented by calling an interp-level function
     (written in Python).
     """
+    __slots__ = ('_pyfunc', '_returns_void', '_def_loc')
     pyfunc: Callable
 
     def __init__(self, w_functype: W_FuncType, fqn: FQN,
                  pyfunc: Callable) -> None:
+        from spy.vm.b import B
         self.w_functype = w_functype
         self.fqn = fqn
-        self.def_loc = Loc.from_pyfunc(pyfunc)
         # _pyfunc should NEVER be called directly, because it bypasses the
         # bluecache
         self._pyfunc = pyfunc
+        # computed once here, because raw_call is very hot
+        self._returns_void = w_functype.w_restype is B.w_void
+        self._def_loc: Optional[Loc] = None
+
+    @property  # type: ignore[override]
+    def def_loc(self) -> Loc:
+        # computed lazily: Loc.from_pyfunc needs inspect.getsourcelines, and
+        # we create ~100 builtin funcs at import time but need their def_loc
+        # only to report errors
+        if self._def_loc is None:
+            self._def_loc = Loc.from_pyfunc(self._pyfunc)
+        return self._def_loc
 
     def __repr__(self) -> str:
         return f"<spy function '{self.fqn}' (builtin)>"
 
     def raw_call(self, vm: 'SPyVM', args_w: Sequence[W_Object]) -> W_Object:
-        from spy.vm.b import B
         w_res = self._pyfunc(vm, *args_w)
-        if w_res is None and self.w_functype.w_restype is B.w_void:
+        if w_res is None and self._returns_void:
             return vm.wrap(None)
         return w_res
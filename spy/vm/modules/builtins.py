@@ -4,7 +4,7 @@ Second half of the `builtins` module.
 The first half is in vm/b.py. See its docstring for more details.
 """
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Annotated
 from spy.vm.builtin import builtin_func
 from spy.vm.primitive import W_F64, W_I32, W_Bool, W_Dynamic, W_Void
 from spy.vm.object import W_Object, W_Type
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from spy.vm.vm import SPyVM
 
 PY_PRINT = print  # type: ignore
+I32_MIN = -2**31
 
 @BUILTINS.builtin_func(color='blue')
 def w_STATIC_TYPE(vm: 'SPyVM', w_expr: W_Object) -> W_Type:
@@ -25,9 +26,17 @@ def w_STATIC_TYPE(vm: 'SPyVM', w_expr: W_Object) -> W_Type:
 
 @BUILTINS.builtin_func
 def w_abs(vm: 'SPyVM', w_x: W_I32) -> W_I32:
-    x = vm.unwrap_i32(w_x)
-    res = vm.ll.call('spy_builtins$abs', x)
-    return vm.wrap(res) # type: ignore
+    # compute it directly to save a round trip into WASM. The only exception
+    # is INT_MIN, on which the C version traps: delegate it to libspy, so
+    # that the interpreter and the C backend behave in the same way
+    x = w_x.value
+    if x == I32_MIN:
+        res = vm.ll.call('spy_builtins$abs', int(x))
+        return vm.wrap(res) # type: ignore
+    return W_I32(abs(x))
+
+# these are leaf classes, so an exact type check is enough
+_PRINT_UNWRAP = frozenset([W_I32, W_F64, W_Bool, W_Str, W_Void])
 
 @BUILTINS.builtin_func
 def w_print(vm: 'SPyVM', w_x: W_Dynamic) -> W_Void:
@@ -36,41 +45,32 @@ def w_print(vm: 'SPyVM', w_x: W_Dynamic) -> W_Void:
 
     It takes just one argument.
     """
-    if isinstance(w_x, (W_I32, W_F64, W_Bool, W_Str, W_Void)):
+    if type(w_x) in _PRINT_UNWRAP:
         PY_PRINT(vm.unwrap(w_x))
     else:
         PY_PRINT(w_x)
     return B.w_None
 
 
-@BUILTINS.builtin_func
-def w_print_i32(vm: 'SPyVM', w_x: W_I32) -> W_Void:
-    PY_PRINT(vm.unwrap(w_x))
-    return B.w_None
-
-@BUILTINS.builtin_func
-def w_print_f64(vm: 'SPyVM', w_x: W_F64) -> W_Void:
-    PY_PRINT(vm.unwrap(w_x))
-    return B.w_None
-
-@BUILTINS.builtin_func
-def w_print_bool(vm: 'SPyVM', w_x: W_Bool) -> W_Void:
-    PY_PRINT(vm.unwrap(w_x))
-    return B.w_None
+def make_print_variant(name: str, w_T: W_Type) -> None:
+    """
+    Make the print_{name} builtin: it is what print() is specialized to
+    during redshift when the argument is statically of type w_T.
+    """
+    T = Annotated[W_Object, w_T]
 
-@BUILTINS.builtin_func
-def w_print_void(vm: 'SPyVM', w_x: W_Void) -> W_Void:
-    PY_PRINT(vm.unwrap(w_x))
-    return B.w_None
+    @BUILTINS.builtin_func(f'print_{name}')
+    def w_print_T(vm: 'SPyVM', w_x: T) -> W_Void:
+        PY_PRINT(vm.unwrap(w_x))
+        return B.w_None
 
-@BUILTINS.builtin_func
-def w_print_str(vm: 'SPyVM', w_x: W_Str) -> W_Void:
-    PY_PRINT(vm.unwrap(w_x))
-    return B.w_None
+for _name in ('i32', 'f64', 'bool', 'void', 'str'):
+    make_print_variant(_name, getattr(B, f'w_{_name}'))
 
 
 # this should belong to function.py, but we cannot put it there because of
 # circular import issues
 @builtin_func('builtins')
 def w_functype_eq(vm: 'SPyVM', w_ft1: W_FuncType, w_ft2: W_FuncType) -> W_Bool:
-    return vm.wrap(w_ft1 == w_ft2)  # type: ignore
+    # functypes are interned, see W_FuncType.new
+    return vm.wrap(w_ft1 is w_ft2)  # type: ignore
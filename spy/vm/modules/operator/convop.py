@@ -79,13 +79,13 @@ def CONVERT_maybe(
 
 @OP.builtin_func
 def w_i32_to_f64(vm: 'SPyVM', w_x: W_I32) -> W_F64:
-    val = vm.unwrap_i32(w_x)
-    return vm.wrap(float(val))  # type: ignore
+    # build the result directly instead of going through unwrap/wrap: this is
+    # called for every implicit i32->f64 conversion
+    return W_F64(float(w_x.value))
 
 @OP.builtin_func
 def w_i32_to_bool(vm: 'SPyVM', w_x: W_I32) -> W_Bool:
-    val = vm.unwrap_i32(w_x)
-    return vm.wrap(bool(val))  # type: ignore
+    return B.w_True if w_x.value else B.w_False
 
 @OP.builtin_func
 def w_f64_to_i32(vm: 'SPyVM', w_x: W_F64) -> W_I32:
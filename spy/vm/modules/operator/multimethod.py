@@ -34,9 +34,20 @@ def parse_type(s: Optional[str]) -> Optional[W_Type]:
 
 class MultiMethodTable:
     impls: dict[KeyType, W_Func]
+    # the types which appear in impls: they are all builtin types
+    _types: set[W_Type]
+    # cache of the results of lookup(), including the misses. It is keyed by
+    # the precise key and avoids trying the partial keys again.
+    #
+    # The table is global, so we cache only lookups of the types in _types:
+    # caching e.g. structs or ptr[T] would keep alive the types of every VM,
+    # and their size would be unbounded.
+    _cache: dict[KeyType, Optional[W_Func]]
 
     def __init__(self) -> None:
         self.impls = {}
+        self._types = set()
+        self._cache = {}
 
     def register(self,
                  op: str,
@@ -49,12 +60,31 @@ class MultiMethodTable:
         key = (op, w_ltype, w_rtype)
         assert key not in self.impls
         self.impls[key] = w_func
+        for w_type in (w_ltype, w_rtype):
+            if w_type is not None:
+                self._types.add(w_type)
+        self._cache.clear()
 
     def register_partial(self, op: str, atype: str, w_func: W_Object) -> None:
         self.register(op, atype, None, w_func)
         self.register(op, None, atype, w_func)
 
     def lookup(self, op: str, w_ltype: W_Type, w_rtype: W_Type) -> W_OpImpl:
+        key = (op, w_ltype, w_rtype)
+        if w_ltype in self._types and w_rtype in self._types:
+            try:
+                w_func = self._cache[key]
+            except KeyError:
+                w_func = self._lookup(op, w_ltype, w_rtype)
+                self._cache[key] = w_func
+        else:
+            w_func = self._lookup(op, w_ltype, w_rtype)
+        if w_func is None:
+            return W_OpImpl.NULL
+        return W_OpImpl(w_func)
+
+    def _lookup(self, op: str, w_ltype: W_Type,
+                w_rtype: W_Type) -> Optional[W_Func]:
         keys = [
             (op, w_ltype, w_rtype),  # most precise lookup
             (op, w_ltype, None),     # less precise ones
@@ -63,8 +93,8 @@ class MultiMethodTable:
         for key in keys:
             w_func = self.impls.get(key)
             if w_func:
-                return W_OpImpl(w_func)
-        return W_OpImpl.NULL
+                return w_func
+        return None
 
     def get_opimpl(self, vm: 'SPyVM', op: str,
                    wop_l: W_OpArg, wop_r: W_OpArg) -> W_Func:
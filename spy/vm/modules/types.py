@@ -22,9 +22,6 @@ TYPES = ModuleRegistry('types')
 TYPES.add('module', W_Module._w)
 
 
-FIELDS_T = dict[str, W_Type]
-METHODS_T = dict[str, W_Func]
-
 @TYPES.builtin_type('LiftedType')
 class W_LiftedType(W_Type):
     w_lltype: W_Type  # low level type
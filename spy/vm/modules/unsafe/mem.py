@@ -1,29 +1,65 @@
 from typing import TYPE_CHECKING, Annotated
-import fixedint
 from spy.vm.b import B
 from spy.vm.primitive import W_I32, W_Dynamic
-from spy.vm.w import W_Func, W_Type, W_Object
+from spy.vm.w import W_Type, W_Object
 from spy.vm.builtin import builtin_func
 from . import UNSAFE
 from .ptr import W_Ptr, w_make_ptr_type, W_PtrType
 from .misc import sizeof
+from .struct import align_up
 
 if TYPE_CHECKING:
     from spy.vm.vm import SPyVM
 
+# Small allocations done by gc_alloc are carved out of bigger chunks, to
+# avoid calling into libspy every time. This is fine because memory
+# allocated by gc_alloc is never freed.
+GC_ALLOC_CHUNK = 64 * 1024
+GC_ALLOC_MAX_POOLED = GC_ALLOC_CHUNK // 2
+GC_ALLOC_ALIGN = 8
+
 @UNSAFE.builtin_func(color='blue')
 def w_gc_alloc(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
+    return make_gc_alloc(vm, w_T, 'gc_alloc', zeroed=False)
+
+
+@UNSAFE.builtin_func(color='blue')
+def w_gc_alloc_zeroed(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
+    """
+    Like gc_alloc, but the memory is filled with zeros
+    """
+    return make_gc_alloc(vm, w_T, 'gc_alloc_zeroed', zeroed=True)
+
+
+def make_gc_alloc(vm: 'SPyVM', w_T: W_Type, funcname: str,
+                  zeroed: bool) -> W_Dynamic:
     w_ptrtype = vm.fast_call(w_make_ptr_type, [w_T])  # unsafe::ptr[i32]
     assert isinstance(w_ptrtype, W_PtrType)
     ITEMSIZE = sizeof(w_T)
+    ll_call = vm.ll.call
+    mem_write = vm.ll.mem.write
+    # the current chunk: the blue cache is per-VM, so is this
+    chunk_next = 0
+    chunk_end = 0
 
     # this is a special builtin function, its C equivalent is automatically
     # generated by c.Context.new_ptr_type
-    @builtin_func(w_ptrtype.fqn, 'gc_alloc')  # unsafe::ptr[i32]::gc_alloc
+    @builtin_func(w_ptrtype.fqn, funcname)  # unsafe::ptr[i32]::gc_alloc
     def w_fn(vm: 'SPyVM', w_n: W_I32) -> Annotated[W_Ptr, w_ptrtype]:
+        nonlocal chunk_next, chunk_end
         n = vm.unwrap_i32(w_n)
         size = ITEMSIZE * n
-        addr = vm.ll.call('spy_gc_alloc_mem', size)
+        if 0 < size <= GC_ALLOC_MAX_POOLED:
+            if chunk_next + size > chunk_end:
+                chunk_next = ll_call('spy_gc_alloc_mem', GC_ALLOC_CHUNK)
+                chunk_end = chunk_next + GC_ALLOC_CHUNK
+            addr = chunk_next
+            chunk_next = align_up(addr + size, GC_ALLOC_ALIGN)
+        else:
+            addr = ll_call('spy_gc_alloc_mem', size)
+        if zeroed and size > 0:
+            # zero the whole block at once, instead of field by field
+            mem_write(addr, bytes(size))
         return W_Ptr(w_ptrtype, addr, n)  # type: ignore
 
     return w_fn
@@ -33,18 +69,31 @@ def w_gc_alloc(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
 def w_mem_read(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
     T = Annotated[W_Object, w_T]
 
-    @builtin_func('unsafe', 'mem_read', [w_T.fqn])  # unsafe::mem_read[i32]
-    def w_mem_read_T(vm: 'SPyVM', w_addr: W_I32) -> T:
-        addr = vm.unwrap_i32(w_addr)
-        if w_T is B.w_i32:
-            return vm.wrap(vm.ll.mem.read_i32(addr))
-        elif w_T is B.w_f64:
-            return vm.wrap(vm.ll.mem.read_f64(addr))
-        elif isinstance(w_T, W_PtrType):
-            v_addr, v_length = vm.ll.mem.read_ptr(addr)
-            return W_Ptr(w_T, v_addr, v_length)
-        else:
-            assert False
+    # dispatch on w_T only once, and return a function which is specialized
+    # for it, e.g. unsafe::mem_read[i32]. The blue cache is per-VM, so it's
+    # safe to look up the vm.ll.mem methods here instead of at every call.
+    if w_T is B.w_i32:
+        read_i32 = vm.ll.mem.read_i32
+        @builtin_func('unsafe', 'mem_read', [w_T.fqn])
+        def w_mem_read_T(vm: 'SPyVM', w_addr: W_I32) -> T:
+            addr = vm.unwrap_i32(w_addr)
+            return vm.wrap(read_i32(addr))
+    elif w_T is B.w_f64:
+        read_f64 = vm.ll.mem.read_f64
+        @builtin_func('unsafe', 'mem_read', [w_T.fqn])
+        def w_mem_read_T(vm: 'SPyVM', w_addr: W_I32) -> T:
+            addr = vm.unwrap_i32(w_addr)
+            return vm.wrap(read_f64(addr))
+    elif isinstance(w_T, W_PtrType):
+        w_ptrtype = w_T
+        read_ptr = vm.ll.mem.read_ptr
+        @builtin_func('unsafe', 'mem_read', [w_T.fqn])
+        def w_mem_read_T(vm: 'SPyVM', w_addr: W_I32) -> T:
+            addr = vm.unwrap_i32(w_addr)
+            v_addr, v_length = read_ptr(addr)
+            return W_Ptr(w_ptrtype, v_addr, v_length)
+    else:
+        assert False
 
     return w_mem_read_T
 
@@ -53,19 +102,27 @@ def w_mem_read(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
 def w_mem_write(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
     T = Annotated[W_Object, w_T]
 
-    @builtin_func('unsafe', 'mem_write', [w_T.fqn])  # unsafe::mem_write[i32]
-    def w_mem_write_T(vm: 'SPyVM', w_addr: W_I32, w_val: T) -> None:
-        addr = vm.unwrap_i32(w_addr)
-        if w_T is B.w_i32:
-            v = vm.unwrap_i32(w_val)
-            vm.ll.mem.write_i32(addr, v)
-        elif w_T is B.w_f64:
-            v = vm.unwrap_f64(w_val)
-            vm.ll.mem.write_f64(addr, v)
-        elif isinstance(w_T, W_PtrType):
+    # see the comment in w_mem_read, e.g. unsafe::mem_write[i32]
+    if w_T is B.w_i32:
+        write_i32 = vm.ll.mem.write_i32
+        @builtin_func('unsafe', 'mem_write', [w_T.fqn])
+        def w_mem_write_T(vm: 'SPyVM', w_addr: W_I32, w_val: T) -> None:
+            addr = vm.unwrap_i32(w_addr)
+            write_i32(addr, vm.unwrap_i32(w_val))
+    elif w_T is B.w_f64:
+        write_f64 = vm.ll.mem.write_f64
+        @builtin_func('unsafe', 'mem_write', [w_T.fqn])
+        def w_mem_write_T(vm: 'SPyVM', w_addr: W_I32, w_val: T) -> None:
+            addr = vm.unwrap_i32(w_addr)
+            write_f64(addr, vm.unwrap_f64(w_val))
+    elif isinstance(w_T, W_PtrType):
+        write_ptr = vm.ll.mem.write_ptr
+        @builtin_func('unsafe', 'mem_write', [w_T.fqn])
+        def w_mem_write_T(vm: 'SPyVM', w_addr: W_I32, w_val: T) -> None:
+            addr = vm.unwrap_i32(w_addr)
             assert isinstance(w_val, W_Ptr)
-            vm.ll.mem.write_ptr(addr, w_val.addr, w_val.length)
-        else:
-            assert False
+            write_ptr(addr, w_val.addr, w_val.length)
+    else:
+        assert False
 
     return w_mem_write_T
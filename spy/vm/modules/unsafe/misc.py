@@ -1,20 +1,38 @@
 from spy.vm.b import B
 from spy.vm.object import W_Type
 
-def sizeof(w_T: W_Type) -> int:
+# (size, alignment) of the types which have a fixed layout
+FIXED_LAYOUTS = {
+    B.w_i32: (4, 4),
+    B.w_f64: (8, 8),
+}
+
+def layoutof(w_T: W_Type) -> tuple[int, int]:
+    """
+    Return (size, alignment) of the given type.
+    """
     from .struct import W_StructType
     from .ptr import W_PtrType
 
-    if w_T is B.w_i32:
-        return 4
-    elif w_T is B.w_f64:
-        return 8
+    layout = FIXED_LAYOUTS.get(w_T)
+    if layout is not None:
+        return layout
     elif isinstance(w_T, W_StructType):
-        return w_T.size
+        return w_T.size, w_T.align
     elif isinstance(w_T, W_PtrType):
         # XXX what is the right size of pointers? For wasm32 is 4 of course,
         # but for native it might be 8. Does it mean that we need to
         # preemptively choose the target platform BEFORE redshifting?
-        return 4 + 4 # in debug mode we store both addr and length
+        #
+        # in debug mode we store both addr and length, as two 32 bit ints
+        return 4 + 4, 4
     else:
         assert False
+
+
+def sizeof(w_T: W_Type) -> int:
+    return layoutof(w_T)[0]
+
+
+def alignof(w_T: W_Type) -> int:
+    return layoutof(w_T)[1]
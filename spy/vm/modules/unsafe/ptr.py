@@ -1,11 +1,11 @@
-from typing import TYPE_CHECKING, ClassVar, Optional, Annotated, Self
+from typing import TYPE_CHECKING, Optional, Annotated, Self
 import fixedint
 from spy.errors import SPyPanicError
 from spy.fqn import FQN
-from spy.vm.primitive import W_I32, W_Dynamic, W_Void, W_Bool
+from spy.vm.primitive import W_I32, W_Dynamic, W_Bool
 from spy.vm.object import Member
 from spy.vm.b import B
-from spy.vm.builtin import builtin_type, builtin_method
+from spy.vm.builtin import builtin_method
 from spy.vm.w import W_Object, W_Type, W_Str, W_Func
 from spy.vm.opimpl import W_OpImpl, W_OpArg
 from spy.vm.builtin import builtin_func
@@ -105,6 +105,7 @@ class W_Ptr(W_BasePtr):
     An actual ptr
     """
     __spy_storage_category__ = 'value'
+    __slots__ = ('w_ptrtype', 'addr', 'length')
 
     # XXX: this works only if we target 32bit platforms such as wasm32, but we
     # need to think of a more general solution
@@ -120,7 +121,8 @@ class W_Ptr(W_BasePtr):
         if addr == 0:
             assert length == 0
         else:
-            assert length >= 1
+            # length can be 0, e.g. for gc_alloc(T)(0)
+            assert length >= 0
         self.w_ptrtype = w_ptrtype
         self.addr = fixedint.Int32(addr)
         self.length = fixedint.Int32(length)
@@ -157,6 +159,7 @@ class W_Ptr(W_BasePtr):
         ITEMSIZE = sizeof(w_T)
         PTR = Annotated[W_Ptr, w_ptrtype]
         T = Annotated[W_Object, w_T]
+        w_mem_read_T = _resolve_mem_func(vm, UNSAFE.w_mem_read, w_T)
 
         @builtin_func(w_ptrtype.fqn, 'load')
         def w_ptr_load_T(vm: 'SPyVM', w_ptr: PTR, w_i: W_I32) -> T:
@@ -168,11 +171,13 @@ class W_Ptr(W_BasePtr):
                 msg = (f"ptr_load out of bounds: 0x{addr:x}[{i}] "
                        f"(upper bound: {length})")
                 raise SPyPanicError(msg)
-            return vm.call_generic(
-                UNSAFE.w_mem_read,
-                [w_T],
-                [vm.wrap(addr)]
-            )
+            if w_mem_read_T is None:
+                return vm.call_generic(
+                    UNSAFE.w_mem_read,
+                    [w_T],
+                    [vm.wrap(addr)]
+                )
+            return vm.fast_call(w_mem_read_T, [vm.wrap(addr)])
         return W_OpImpl(w_ptr_load_T)
 
     @builtin_method('__SETITEM__', color='blue')
@@ -184,6 +189,7 @@ class W_Ptr(W_BasePtr):
         ITEMSIZE = sizeof(w_T)
         PTR = Annotated[W_Ptr, w_ptrtype]
         T = Annotated[W_Object, w_T]
+        w_mem_write_T = _resolve_mem_func(vm, UNSAFE.w_mem_write, w_T)
 
         @builtin_func(w_ptrtype.fqn, 'store')
         def w_ptr_store_T(vm: 'SPyVM', w_ptr: PTR, w_i: W_I32, w_v: T)-> None:
@@ -195,11 +201,14 @@ class W_Ptr(W_BasePtr):
                 msg = (f"ptr_store out of bounds: 0x{addr:x}[{i}] "
                        f"(upper bound: {length})")
                 raise SPyPanicError(msg)
-            vm.call_generic(
-                UNSAFE.w_mem_write,
-                [w_T],
-                [vm.wrap(addr), w_v]
-            )
+            if w_mem_write_T is None:
+                vm.call_generic(
+                    UNSAFE.w_mem_write,
+                    [w_T],
+                    [vm.wrap(addr), w_v]
+                )
+            else:
+                vm.fast_call(w_mem_write_T, [vm.wrap(addr), w_v])
         return W_OpImpl(w_ptr_store_T)
 
     @builtin_method('__EQ__', color='blue')
@@ -282,10 +291,10 @@ class W_Ptr(W_BasePtr):
 
         assert isinstance(w_T, W_StructType)
         attr = wop_attr.blue_unwrap_str(vm)
-        if attr not in w_T.fields:
+        w_field_T = w_T.fields.get(attr)
+        if w_field_T is None:
             return W_OpImpl.NULL
 
-        w_field_T = w_T.fields[attr]
         offset = w_T.offsets[attr]
         wop_offset = W_OpArg.from_w_obj(vm, vm.wrap(offset))
 
@@ -304,44 +313,71 @@ class W_Ptr(W_BasePtr):
 
 
 
+def _resolve_mem_func(vm: 'SPyVM', w_generic: W_Func,
+                      w_T: W_Type) -> Optional[W_Func]:
+    """
+    Resolve mem_read[T] or mem_write[T] ahead of time, so that the red
+    function doesn't need to look it up at every call.
+
+    This works only for the types supported by mem_read/mem_write. For the
+    others (e.g. structs) we return None and the lookup is done lazily, else
+    we could not even redshift code which loads/stores structs by value.
+    """
+    if w_T is B.w_i32 or w_T is B.w_f64 or isinstance(w_T, W_PtrType):
+        w_func = vm.fast_call(w_generic, [w_T])
+        assert isinstance(w_func, W_Func)
+        return w_func
+    return None
+
+
 @UNSAFE.builtin_func(color='blue')
 def w_getfield(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
     # fields can be returned "by value" or "by reference". Primitive types
     # returned by value, but struct types are always returned by reference
     # (i.e., we return a pointer to it).
-    if w_T.is_struct(vm):
-        w_T = vm.fast_call(w_make_ptr_type, [w_T])  # type: ignore
-        by = 'byref'
-    else:
-        by = 'byval'
-
-    T = Annotated[W_Object, w_T]
-
+    #
     # e.g.:
     # unsafe::getfield_byval[i32]
     # unsafe::getfield_byref[ptr[Point]]
-    @builtin_func('unsafe', f'getfield_{by}', [w_T.fqn])
-    def w_getfield_T(vm: 'SPyVM', w_ptr: W_Ptr, w_attr: W_Str,
-                     w_offset: W_I32) -> T:
-        """
-        NOTE: w_attr is ignored here, but it's used by the C backend
-        """
-        addr = w_ptr.addr + vm.unwrap_i32(w_offset)
-        if by == 'byref':
-            assert isinstance(w_T, W_PtrType)
-            return W_Ptr(w_T, addr, 1)
-        else:
-            return vm.call_generic(
-                UNSAFE.w_mem_read,
-                [w_T],
-                [vm.wrap(addr)]
-            )
+    #
+    # NOTE: w_attr is ignored by the returned functions, but it's used by the
+    # C backend
+    if w_T.is_struct(vm):
+        w_ptrtype: W_PtrType = vm.fast_call(  # type: ignore
+            w_make_ptr_type, [w_T])
+        PTR = Annotated[W_Ptr, w_ptrtype]
+
+        @builtin_func('unsafe', 'getfield_byref', [w_ptrtype.fqn])
+        def w_getfield_T(vm: 'SPyVM', w_ptr: W_Ptr, w_attr: W_Str,
+                         w_offset: W_I32) -> PTR:
+            addr = w_ptr.addr + vm.unwrap_i32(w_offset)
+            return W_Ptr(w_ptrtype, addr, 1)
+
+    else:
+        T = Annotated[W_Object, w_T]
+        # the offset is added at runtime, but the mem_read[T] to call is
+        # known already, no need to look it up at every call
+        w_mem_read_T = _resolve_mem_func(vm, UNSAFE.w_mem_read, w_T)
+
+        @builtin_func('unsafe', 'getfield_byval', [w_T.fqn])
+        def w_getfield_T(vm: 'SPyVM', w_ptr: W_Ptr, w_attr: W_Str,
+                         w_offset: W_I32) -> T:
+            addr = w_ptr.addr + vm.unwrap_i32(w_offset)
+            if w_mem_read_T is None:
+                return vm.call_generic(
+                    UNSAFE.w_mem_read,
+                    [w_T],
+                    [vm.wrap(addr)]
+                )
+            return vm.fast_call(w_mem_read_T, [vm.wrap(addr)])
+
     return w_getfield_T
 
 
 @UNSAFE.builtin_func(color='blue')
 def w_setfield(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
     T = Annotated[W_Object, w_T]
+    w_mem_write_T = _resolve_mem_func(vm, UNSAFE.w_mem_write, w_T)
 
     @builtin_func('unsafe', 'setfield', [w_T.fqn])  # unsafe::setfield[i32]
     def w_setfield_T(vm: 'SPyVM', w_ptr: W_Ptr, w_attr: W_Str,
@@ -350,9 +386,12 @@ def w_setfield(vm: 'SPyVM', w_T: W_Type) -> W_Dynamic:
         NOTE: w_attr is ignored here, but it's used by the C backend
         """
         addr = w_ptr.addr + vm.unwrap_i32(w_offset)
-        vm.call_generic(
-            UNSAFE.w_mem_write,
-            [w_T],
-            [vm.wrap(addr), w_val]
-        )
+        if w_mem_write_T is None:
+            vm.call_generic(
+                UNSAFE.w_mem_write,
+                [w_T],
+                [vm.wrap(addr), w_val]
+            )
+        else:
+            vm.fast_call(w_mem_write_T, [vm.wrap(addr), w_val])
     return w_setfield_T
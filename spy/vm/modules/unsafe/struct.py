@@ -1,30 +1,28 @@
-from typing import TYPE_CHECKING, Any, Optional, Type, ClassVar
-from dataclasses import dataclass
-import fixedint
-from spy.fqn import FQN
-from spy.vm.function import W_Func
-from spy.vm.primitive import W_I32, W_Void
-from spy.vm.b import B
-from spy.vm.object import W_Object, W_Type, ClassBody, FIELDS_T
-from spy.vm.builtin import builtin_func
-from spy.vm.opimpl import W_OpImpl, W_OpArg
+from typing import TYPE_CHECKING, Mapping
+from types import MappingProxyType
+from spy.vm.object import W_Object, W_Type, ClassBody
 from . import UNSAFE
 if TYPE_CHECKING:
     from spy.vm.vm import SPyVM
-    from spy.vm.opimpl import W_OpImpl, W_OpArg
 
+# the fields of a struct cannot change after its layout has been computed,
+# so W_StructType stores them as a read-only mapping
+STRUCT_FIELDS_T = Mapping[str, W_Type]
 OFFSETS_T = dict[str, int]
 
 @UNSAFE.builtin_type('StructType')
 class W_StructType(W_Type):
-    fields: FIELDS_T
+    __slots__ = ('fields', 'offsets', 'size', 'align')
+
+    fields: STRUCT_FIELDS_T
     offsets: OFFSETS_T
     size: int
+    align: int
 
     def define_from_classbody(self, body: ClassBody) -> None:
         super().define(W_Struct)
-        self.fields = body.fields
-        self.offsets, self.size = calc_layout(body.fields)
+        self.fields = MappingProxyType(dict(body.fields))
+        self.offsets, self.size, self.align = calc_layout(self.fields)
         assert body.methods == {}
 
     def repr_hints(self) -> list[str]:
@@ -34,20 +32,37 @@ class W_StructType(W_Type):
         return True
 
 
-def calc_layout(fields: FIELDS_T) -> tuple[OFFSETS_T, int]:
-    from spy.vm.modules.unsafe.misc import sizeof
+def calc_layout(fields: STRUCT_FIELDS_T) -> tuple[OFFSETS_T, int, int]:
+    """
+    Compute the offsets, the size and the alignment of a struct.
+
+    The rules are the same as C: each field is aligned to its own
+    alignment, and the total size is a multiple of the alignment of the
+    struct, so that they can be put in arrays. Note that alignment is NOT
+    the same as the size: e.g. a struct containing three i32 is 12 bytes
+    but is only 4-aligned.
+    """
+    from spy.vm.modules.unsafe.misc import layoutof
     offset = 0
     offsets = {}
+    struct_align = 1
     for field, w_type in fields.items():
-        field_size = sizeof(w_type)
-        # compute alignment
-        offset = (offset + (field_size - 1)) & ~(field_size - 1)
+        field_size, field_align = layoutof(w_type)
+        offset = align_up(offset, field_align)
         offsets[field] = offset
         offset += field_size
-    size = offset
-    return offsets, size
+        struct_align = max(struct_align, field_align)
+    size = align_up(offset, struct_align)
+    return offsets, size, struct_align
+
+
+def align_up(n: int, align: int) -> int:
+    """
+    Round n up to the next multiple of align
+    """
+    return (n + align - 1) // align * align
 
 
 @UNSAFE.builtin_type('struct')
 class W_Struct(W_Object):
-    pass
+    __slots__ = ()
@@ -385,9 +385,11 @@ class W_Type(W_Object):
         Lookup the given attribute into the applevel dict, and ensure it's
         a W_Func.
         """
-        from spy.vm.function import W_Func
         # look in our dict
         if w_obj := self.dict_w.get(name):
+            # the import is needed only for the sanity check: don't pay for
+            # it on every level of the w_base chain
+            from spy.vm.function import W_Func
             assert isinstance(w_obj, W_Func)
             return w_obj
 
@@ -35,6 +35,14 @@ W_OpImpl._w.define(W_OpImpl)
 W_OpArg._w.define(W_OpArg)
 W_FuncType._w.define(W_FuncType)
 
+# OPERATORs which call_OP keeps blue on the receiver and on the
+# attribute/method name, respectively. See the <TEMPORARY HACK> there.
+_BLUE_RECEIVER_OPS = (OPERATOR.w_CALL, OPERATOR.w_CALL_METHOD,
+                      OPERATOR.w_GETATTR, OPERATOR.w_GETITEM,
+                      OPERATOR.w_SETATTR, OPERATOR.w_SETITEM)
+_BLUE_ATTR_OPS = (OPERATOR.w_GETATTR, OPERATOR.w_SETATTR,
+                  OPERATOR.w_CALL_METHOD)
+
 
 class SPyVM:
     """
@@ -45,16 +53,20 @@ class SPyVM:
     """
     ll: libspy.LLSPyInstance
     globals_w: dict[FQN, W_Object]
+    _reverse_globals_w: dict[W_Object, FQN]
     modules_w: dict[str, W_Module]
     path: list[str]
     bluecache: BlueCache
+    _issubclass_cache: dict[tuple[W_Type, W_Type], bool]
 
     def __init__(self) -> None:
         self.ll = libspy.LLSPyInstance(libspy.LLMOD)
         self.globals_w = {}
+        self._reverse_globals_w = {}
         self.modules_w = {}
         self.path = []
         self.bluecache = BlueCache(self)
+        self._issubclass_cache = {}
         self.make_module(BUILTINS)   # builtins::
         self.make_module(OPERATOR)   # operator::
         self.make_module(TYPES)      # types::
@@ -129,6 +141,7 @@ class SPyVM:
         w_existing = self.globals_w.get(fqn)
         if w_existing is None:
             self.globals_w[fqn] = w_value
+            self._reverse_globals_w.setdefault(w_value, fqn)
         else:
             raise ValueError(f"'{fqn}' already exists")
 
@@ -139,10 +152,17 @@ class SPyVM:
             return self.globals_w.get(fqn)
 
     def reverse_lookup_global(self, w_val: W_Object) -> Optional[FQN]:
-        # XXX we should maintain a reverse-lookup table instead of doing a
-        # linear search
+        # this is called by make_fqn_const, i.e. every time that a frame
+        # declares a local, so we keep a reverse-lookup table. Entries can
+        # become stale when a global is overwritten (e.g. by store_global or
+        # by redshift): in that case we fall back to a linear search and
+        # update the table.
+        fqn = self._reverse_globals_w.get(w_val)
+        if fqn is not None and self.globals_w.get(fqn) is w_val:
+            return fqn
         for fqn, w_obj in self.globals_w.items():
             if w_val == w_obj:
+                self._reverse_globals_w[w_val] = fqn
                 return fqn
         return None
 
@@ -192,8 +212,18 @@ class SPyVM:
     def issubclass(self, w_sub: W_Type, w_super: W_Type) -> bool:
         assert isinstance(w_super, W_Type)
         assert isinstance(w_sub, W_Type)
-        if w_super is B.w_dynamic:
+        if w_super is B.w_dynamic or w_sub is w_super:
             return True
+        # the base of a type never changes once it's defined, so we can
+        # cache the result of walking the w_base chain
+        key = (w_sub, w_super)
+        res = self._issubclass_cache.get(key)
+        if res is None:
+            res = self._issubclass(w_sub, w_super)
+            self._issubclass_cache[key] = res
+        return res
+
+    def _issubclass(self, w_sub: W_Type, w_super: W_Type) -> bool:
         w_class = w_sub
         while w_class is not B.w_None:
             if w_class is w_super:
@@ -354,13 +384,11 @@ class SPyVM:
         #      name blue
         #
         #   3. everything else becomes red
-        OP = OPERATOR
         new_args_wop = [wop.as_red(self) for wop in args_wop]
 
-        if w_OP in (OP.w_CALL, OP.w_CALL_METHOD, OP.w_GETATTR,
-                    OP.w_GETITEM, OP.w_SETATTR, OP.w_SETITEM):
+        if w_OP in _BLUE_RECEIVER_OPS:
             new_args_wop[0] = args_wop[0]
-        if w_OP in (OP.w_GETATTR, OP.w_SETATTR, OP.w_CALL_METHOD):
+        if w_OP in _BLUE_ATTR_OPS:
             new_args_wop[1] = args_wop[1]
         # </TEMPORARY HACK>
 